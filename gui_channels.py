@@ -1,40 +1,269 @@
 import sys
 import json
-import os
+import re
 from datetime import datetime, timezone
-from pathlib import Path
-from typing import Dict, Any, Optional, List, TYPE_CHECKING
-import subprocess
+from typing import Dict, Any, Optional, List, Tuple, Callable, TYPE_CHECKING
 import threading
 import time
+import heapq
+import itertools
+from collections import OrderedDict
+from functools import lru_cache, partial
+import queue
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 
 import autobot
+from app_paths import default_runtime_root
 
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout,
+    QApplication, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout,
     QFormLayout, QLineEdit, QTextEdit, QComboBox, QSpinBox, QCheckBox, QPushButton,
-    QLabel, QFileDialog, QMessageBox, QTableWidget, QTableWidgetItem, QHeaderView,
-    QSplitter, QGroupBox, QScrollArea, QProgressBar, QStatusBar, QMenuBar, QMenu,
-    QDialog, QDialogButtonBox, QGridLayout, QFrame, QListWidget, QListWidgetItem,
-    QSizePolicy, QToolButton, QButtonGroup, QInputDialog, QAbstractItemView
+    QLabel, QFileDialog, QMessageBox, QTableView, QHeaderView,
+    QGroupBox, QProgressBar, QMenu,
+    QDialog, QDialogButtonBox,
+    QSizePolicy, QToolButton, QButtonGroup, QInputDialog, QAbstractItemView,
+    QStyledItemDelegate, QStyleOptionButton, QStyleOptionViewItem, QStyle
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer, QSettings
-from PySide6.QtGui import QIcon, QFont, QPixmap, QAction
+from PySide6.QtCore import (
+    Qt, QObject, Signal, QSignalBlocker, QTimer, QAbstractTableModel, QModelIndex, QEvent, QRect, QSize, QUrl,
+    QSettings
+)
+from PySide6.QtGui import QAction
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkProxy, QNetworkReply, QNetworkRequest
 
 from localization import translator, tr
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 if TYPE_CHECKING:
     from gui_main import ConfigManager
 else:
     ConfigManager = Any
 
 
-class ChannelPipelineWorker(QThread):
-    """Background worker to run the automation pipeline for a channel."""
+def _json_loads(text: str) -> Any:
+    """Parse JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps_indented(value: Any) -> str:
+    """Serialize ``value`` as two-space indented JSON text."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            # orjson rejects non-str keys and oversized ints; the stdlib copes
+            pass
+    return json.dumps(value, indent=2)
+
+
+def _json_write_indented(path: str, value: Any) -> None:
+    """Write ``value`` to ``path`` as two-space indented JSON in one write call."""
+    data = None
+    if orjson is not None:
+        try:
+            data = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    if data is None:
+        data = json.dumps(value, indent=2).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+# host:port or host:port:username:password; emptiness and port range are checked after matching
+_PROXY_RE = re.compile(r"([^:]*):\s*([0-9]+)\s*(?::([^:]*):([^:]*))?")
+
+_PROXY_TEST_URL = "https://www.google.com"
+_PROXY_TEST_TIMEOUT_MS = 10000
+_network_manager: Optional[QNetworkAccessManager] = None
+
+
+def _proxy_test_manager() -> QNetworkAccessManager:
+    """Return the shared network manager, creating it on first use (GUI thread)."""
+    global _network_manager
+    if _network_manager is None:
+        _network_manager = QNetworkAccessManager()
+    return _network_manager
+
+
+class _DaemonPool:
+    """Minimal thread pool whose threads are daemons and start on demand.
+
+    ThreadPoolExecutor joins its threads at interpreter exit, so a render or
+    upload that ignores the stop event would keep the process alive after the
+    window has closed.
+    """
+
+    def __init__(self, max_workers: int, name: str):
+        self._max_workers = max_workers
+        self._name = name
+        self._tasks: "queue.SimpleQueue[Tuple[Future, Callable[..., Any], Tuple[Any, ...]]]" = queue.SimpleQueue()
+        self._idle_workers = threading.Semaphore(0)
+        self._workers: List[threading.Thread] = []
+        self._workers_lock = threading.Lock()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        future: Future = Future()
+        self._tasks.put((future, fn, args))
+        # Reuse an idle thread when there is one, otherwise grow up to the cap
+        if not self._idle_workers.acquire(blocking=False):
+            with self._workers_lock:
+                if len(self._workers) < self._max_workers:
+                    thread = threading.Thread(
+                        target=self._work,
+                        name=f"{self._name}_{len(self._workers)}",
+                        daemon=True,
+                    )
+                    self._workers.append(thread)
+                    thread.start()
+        return future
+
+    def _work(self) -> None:
+        while True:
+            future, fn, args = self._tasks.get()
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args)
+                except BaseException as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+            del future, fn, args
+            self._idle_workers.release()
+
+
+class ChannelScanScheduler:
+    """Drives every channel's scan cadence from one timer thread and two pools.
+
+    Scans are short and go to the scan pool; downloads, renders and uploads
+    take minutes and go to the processing pool, so a busy processing pool
+    never delays another channel's scan.
+    """
+
+    _instance: Optional["ChannelScanScheduler"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_workers: int = 32, scan_workers: int = 8):
+        self._scan_pool = _DaemonPool(scan_workers, "channel-scan")
+        self._processing_pool = _DaemonPool(max_workers, "channel-pipeline")
+        # (due monotonic time, sequence, callback); callbacks must return quickly
+        self._heap: List[Tuple[float, int, Callable[[], None]]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def instance(cls) -> "ChannelScanScheduler":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Run a short task (setup or a scan) on the scan pool."""
+        return self._scan_pool.submit(fn, *args)
+
+    def submit_processing(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Run a long task (download, render, upload) on the processing pool."""
+        return self._processing_pool.submit(fn, *args)
+
+    def schedule(self, callback: Callable[[], None], delay: float) -> None:
+        """Run ``callback`` on the scheduler thread once ``delay`` seconds have passed."""
+        due = time.monotonic() + max(0.0, delay)
+        with self._condition:
+            heapq.heappush(self._heap, (due, next(self._sequence), callback))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="channel-scan-scheduler", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._heap or self._heap[0][0] > time.monotonic():
+                    timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                    self._condition.wait(timeout)
+                # Pop every channel that is due in one pass
+                now = time.monotonic()
+                due = []
+                while self._heap and self._heap[0][0] <= now:
+                    due.append(heapq.heappop(self._heap))
+            for _, _, callback in due:
+                try:
+                    callback()
+                except Exception as exc:
+                    # One bad channel must not stop the timer thread for the rest
+                    print(f"Channel scan scheduler callback failed: {exc}")
+
+
+@dataclass(slots=True)
+class _WorkerState:
+    """Per-channel bookkeeping for ChannelPipelineWorker, kept off the QObject's __dict__."""
+
+    channel_id: str
+    config_manager: Any
+    video_url: Optional[str]
+    stop_requested: threading.Event = field(default_factory=threading.Event)
+    done: threading.Event = field(default_factory=threading.Event)
+    started: bool = False
+    # Scan scheduling; guarded by scan_lock against the scheduler thread and the GUI
+    scan_lock: threading.Lock = field(default_factory=threading.Lock)
+    waiting: bool = False
+    generation: int = 0
+    wake_pending: bool = False
+    pipeline_steps: Dict[str, bool] = field(default_factory=dict)
+    scan_interval: int = 5
+    # template key -> (template, message formatted with scan_interval)
+    scan_messages: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    # Progress is throttled to one emit per window; the newest message wins
+    progress_lock: threading.Lock = field(default_factory=threading.Lock)
+    pending_progress: Optional[str] = None
+    progress_flush_scheduled: bool = False
+    last_progress_emit: float = 0.0
+
+
+class ChannelPipelineWorker(QObject):
+    """Runs the automation pipeline for a channel on the shared scan scheduler.
+
+    Keeps the start/request_stop/wait/isRunning surface of the former
+    per-channel QThread, but owns no thread: setup, scans and video
+    processing run on the ChannelScanScheduler pools.
+    """
 
     progress = Signal(str, str)  # channel_id, message
     finished = Signal(str, bool, str)  # channel_id, success, summary
 
+    # Shared across workers so extractor setup and the player JS cache are paid once
+    _ydl_instance = None
+    _ydl_lock = threading.Lock()
+
+    # url -> (fetched_at, {"id", "title", "upload_date"}), oldest first
+    _VIDEO_INFO_TTL = 24 * 60 * 60
+    _VIDEO_INFO_MAX = 256
+    _video_info_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    _video_info_lock = threading.Lock()
+
+    _PROGRESS_WINDOW = 0.1
+
+    # Scan-loop messages, translated once per language instead of per scan
+    _TEMPLATE_SOURCES = {
+        "scanning": "Scanning every {seconds}s for new videos...",
+        "scan_error": "Error checking videos: {error}",
+        "errors_waiting": "⚠ Pipeline finished with errors; waiting for next scan",
+        "no_videos": "No new videos. Next scan in {seconds}s",
+        "processing": "Processing video: {title}",
+    }
+    _templates: Dict[str, str] = {}
+
     def __init__(
         self,
         channel_id: str,
@@ -42,168 +271,327 @@ class ChannelPipelineWorker(QThread):
         video_url: Optional[str] = None,
     ):
         super().__init__()
-        self.channel_id = channel_id
-        self.config_manager = config_manager
-        self.video_url = video_url.strip() if video_url else None
-        self._stop_requested = threading.Event()
+        self._state = _WorkerState(
+            channel_id=channel_id,
+            config_manager=config_manager,
+            video_url=video_url.strip() if video_url else None,
+        )
+        self._scheduler = ChannelScanScheduler.instance()
 
-    def request_stop(self) -> None:
-        self._stop_requested.set()
+    @property
+    def channel_id(self) -> str:
+        return self._state.channel_id
 
-    def run(self) -> None:
-        try:
-            self.progress.emit(self.channel_id, tr("Preparing pipeline environment..."))
-            settings = self.config_manager.load_settings()
-            autobot.APP_CONFIGS = settings
+    @property
+    def config_manager(self) -> ConfigManager:
+        return self._state.config_manager
+
+    @property
+    def video_url(self) -> Optional[str]:
+        return self._state.video_url
 
-            channels = self.config_manager.get_channels()
-            autobot.ALL_CONFIGS = channels
+    @classmethod
+    def _build_templates(cls, language_code: Optional[str] = None) -> None:
+        cls._templates = {key: tr(text) for key, text in cls._TEMPLATE_SOURCES.items()}
+
+    def start(self) -> None:
+        if self._state.started:
+            return
+        self._state.started = True
+        self._scheduler.submit(self._run_guarded, self._prepare)
 
-            channel_data = channels.get(self.channel_id)
-            if not channel_data:
-                self.finished.emit(self.channel_id, False, tr("Channel configuration not found"))
+    def isRunning(self) -> bool:
+        return self._state.started and not self._state.done.is_set()
+
+    def wait(self, msecs: Optional[int] = None) -> bool:
+        if not self._state.started:
+            return True
+        return self._state.done.wait(None if msecs is None else msecs / 1000)
+
+    def request_stop(self) -> None:
+        self._state.stop_requested.set()
+        # Pull a sleeping channel forward so it finishes now
+        self._wake()
+
+    def notify_new_video(self) -> None:
+        """Trigger the next scan now instead of waiting out the scan interval."""
+        self._wake()
+
+    def is_stopping(self) -> bool:
+        return self._state.stop_requested.is_set()
+
+    def _wake(self) -> None:
+        with self._state.scan_lock:
+            if self._state.waiting:
+                self._state.generation += 1
+                self._scheduler.schedule(partial(self._dispatch_scan, self._state.generation), 0)
+            else:
+                self._state.wake_pending = True
+
+    def _schedule_next_scan(self) -> None:
+        with self._state.scan_lock:
+            delay = 0 if self._state.wake_pending else self._state.scan_interval
+            self._state.wake_pending = False
+            self._state.waiting = True
+            self._state.generation += 1
+            self._scheduler.schedule(partial(self._dispatch_scan, self._state.generation), delay)
+
+    def _dispatch_scan(self, generation: int) -> None:
+        with self._state.scan_lock:
+            if not self._state.waiting or generation != self._state.generation:
+                return
+            self._state.waiting = False
+        self._scheduler.submit(self._run_guarded, self._scan_once)
+
+    def _scan_message(self, key: str) -> str:
+        """Return template ``key`` formatted with this channel's scan interval."""
+        template = self._templates[key]
+        cached = self._state.scan_messages.get(key)
+        # A language change swaps in new template objects, which misses here
+        if cached is None or cached[0] is not template:
+            cached = (template, template.format(seconds=self._state.scan_interval))
+            self._state.scan_messages[key] = cached
+        return cached[1]
+
+    def _report(self, message: str) -> None:
+        now = time.monotonic()
+        # Emits happen under progress_lock so none can land after _finish's summary
+        with self._state.progress_lock:
+            if self._state.done.is_set():
+                return
+            if self._state.progress_flush_scheduled:
+                self._state.pending_progress = message
+                return
+            wait = self._state.last_progress_emit + self._PROGRESS_WINDOW - now
+            if wait > 0:
+                self._state.pending_progress = message
+                self._state.progress_flush_scheduled = True
+                self._scheduler.schedule(self._flush_progress, wait)
                 return
+            self._state.last_progress_emit = now
+            self.progress.emit(self._state.channel_id, message)
+
+    def _flush_progress(self) -> None:
+        with self._state.progress_lock:
+            message, self._state.pending_progress = self._state.pending_progress, None
+            self._state.progress_flush_scheduled = False
+            if message is None or self._state.done.is_set():
+                return
+            self._state.last_progress_emit = time.monotonic()
+            self.progress.emit(self._state.channel_id, message)
+
+    def _finish(self, success: bool, message: str) -> None:
+        # The final summary supersedes any progress still waiting to be flushed;
+        # done is set under the lock so no later progress emit can follow it
+        with self._state.progress_lock:
+            self._state.pending_progress = None
+            self._state.done.set()
+        self.finished.emit(self._state.channel_id, success, message)
+
+    def _run_guarded(self, step: Callable[[], None]) -> None:
+        try:
+            step()
+        except Exception as exc:
+            self._finish(False, tr("Error: {error}").format(error=exc))
 
-            channel_config = channel_data['config']
-            pipeline_steps = autobot._sanitize_pipeline_steps(
-                channel_config.get("pipeline_steps")
-            )
-            scan_interval = max(1, int(channel_config.get("scan_interval", 5)))
-
-            manual_video = None
-            if self.video_url:
-                manual_video = self._create_video_from_url(self.video_url, channel_config)
-                if not manual_video:
-                    self.finished.emit(
-                        self.channel_id,
-                        False,
-                        tr("Failed to resolve video details from URL"),
-                    )
-                    return
+    def _prepare(self) -> None:
+        self._report(tr("Preparing pipeline environment..."))
+        # Publishes autobot.APP_CONFIGS whenever settings.json has changed
+        self._state.config_manager.load_settings_cached()
 
-            if not pipeline_steps.get("scan", True):
-                if not manual_video:
-                    self.finished.emit(
-                        self.channel_id,
-                        False,
-                        tr("Video URL required when scan step is disabled"),
-                    )
-                    return
+        channels = self._state.config_manager.get_channels()
+        autobot.ALL_CONFIGS = channels
 
-                success = self._process_video(manual_video, pipeline_steps)
-                if self._stop_requested.is_set():
-                    self.finished.emit(self.channel_id, False, tr("Pipeline cancelled"))
-                elif success:
-                    self.finished.emit(self.channel_id, True, tr("Pipeline completed successfully"))
-                else:
-                    self.finished.emit(self.channel_id, False, tr("Pipeline finished with errors"))
+        channel_data = channels.get(self._state.channel_id)
+        if not channel_data:
+            self._finish(False, tr("Channel configuration not found"))
+            return
+
+        channel_config = channel_data['config']
+        pipeline_steps = autobot._sanitize_pipeline_steps(
+            channel_config.get("pipeline_steps")
+        )
+        scan_interval = max(1, int(channel_config.get("scan_interval", 5)))
+        self._state.pipeline_steps = pipeline_steps
+        self._state.scan_interval = scan_interval
+
+        manual_video = None
+        if self._state.video_url:
+            manual_video = self._create_video_from_url(self._state.video_url, channel_config)
+            if not manual_video:
+                self._finish(False, tr("Failed to resolve video details from URL"))
                 return
 
-            if manual_video:
-                success = self._process_video(manual_video, pipeline_steps)
-                if self._stop_requested.is_set():
-                    self.finished.emit(self.channel_id, True, tr("Stopped by user"))
-                    return
-                if not success:
-                    self.finished.emit(self.channel_id, False, tr("Pipeline finished with errors"))
-                    return
+        if not pipeline_steps.get("scan", True) and not manual_video:
+            self._finish(False, tr("Video URL required when scan step is disabled"))
+            return
 
-            self.progress.emit(
-                self.channel_id,
-                tr("Scanning every {seconds}s for new videos...").format(seconds=scan_interval),
+        if manual_video:
+            self._scheduler.submit_processing(
+                self._run_guarded, partial(self._process_manual_video, manual_video)
             )
+            return
 
-            while not self._stop_requested.is_set():
-                try:
-                    video = autobot.check_new_video(self.channel_id)
-                except Exception as err:
-                    self.progress.emit(
-                        self.channel_id,
-                        tr("Error checking videos: {error}").format(error=err),
-                    )
-                    if self._wait_with_stop(scan_interval):
-                        break
-                    continue
+        self._report(self._scan_message("scanning"))
+        self._scan_once()
 
-                if self._stop_requested.is_set():
-                    break
+    def _process_manual_video(self, manual_video: autobot.Video) -> None:
+        pipeline_steps = self._state.pipeline_steps
+        success = self._process_video(manual_video, pipeline_steps)
+        if not pipeline_steps.get("scan", True):
+            if self._state.stop_requested.is_set():
+                self._finish(False, tr("Pipeline cancelled"))
+            elif success:
+                self._finish(True, tr("Pipeline completed successfully"))
+            else:
+                self._finish(False, tr("Pipeline finished with errors"))
+            return
 
-                if video:
-                    success = self._process_video(video, pipeline_steps)
-                    if not success and not self._stop_requested.is_set():
-                        self.progress.emit(
-                            self.channel_id,
-                            tr("⚠ Pipeline finished with errors; waiting for next scan"),
-                        )
-                else:
-                    self.progress.emit(
-                        self.channel_id,
-                        tr("No new videos. Next scan in {seconds}s").format(seconds=scan_interval),
-                    )
+        if self._state.stop_requested.is_set():
+            self._finish(True, tr("Stopped by user"))
+            return
+        if not success:
+            self._finish(False, tr("Pipeline finished with errors"))
+            return
 
-                if self._wait_with_stop(scan_interval):
-                    break
+        self._report(self._scan_message("scanning"))
+        # Back to the scan pool; this processing thread is needed for renders
+        self._scheduler.submit(self._run_guarded, self._scan_once)
 
-            if self._stop_requested.is_set():
-                self.finished.emit(self.channel_id, True, tr("Stopped by user"))
-            else:
-                self.finished.emit(self.channel_id, True, tr("Scanner stopped"))
+    def _scan_once(self) -> None:
+        if self._state.stop_requested.is_set():
+            self._finish(True, tr("Stopped by user"))
+            return
 
-        except Exception as exc:
-            self.finished.emit(
-                self.channel_id,
-                False,
-                tr("Error: {error}").format(error=exc),
+        try:
+            video = autobot.check_new_video(self._state.channel_id)
+        except Exception as err:
+            self._report(self._templates["scan_error"].format(error=err))
+            self._schedule_next_scan()
+            return
+
+        if self._state.stop_requested.is_set():
+            self._finish(True, tr("Stopped by user"))
+            return
+
+        if video:
+            self._scheduler.submit_processing(
+                self._run_guarded, partial(self._process_new_video, video)
             )
+            return
+
+        self._report(self._scan_message("no_videos"))
+        self._schedule_next_scan()
 
-    def _wait_with_stop(self, seconds: int) -> bool:
-        seconds = max(0, int(seconds))
-        if seconds <= 0:
-            return self._stop_requested.is_set()
-        return self._stop_requested.wait(timeout=seconds)
+    def _process_new_video(self, video: autobot.Video) -> None:
+        success = self._process_video(video, self._state.pipeline_steps)
+        if not success and not self._state.stop_requested.is_set():
+            self._report(self._templates["errors_waiting"])
+        self._schedule_next_scan()
 
     def _process_video(self, video: autobot.Video, pipeline_steps: Dict[str, bool]) -> bool:
-        if self._stop_requested.is_set():
+        if self._state.stop_requested.is_set():
             return False
 
         video_title = getattr(video, 'title', 'Unknown title')
-        self.progress.emit(
-            self.channel_id,
-            tr("Processing video: {title}").format(title=video_title),
-        )
+        self._report(self._templates["processing"].format(title=video_title))
 
         try:
             success = autobot.process_video_pipeline(
-                self.channel_id,
+                self._state.channel_id,
                 video,
                 pipeline_steps=pipeline_steps,
-                stop_event=self._stop_requested,
-                progress_callback=lambda message: self.progress.emit(
-                    self.channel_id, message
-                ),
+                stop_event=self._state.stop_requested,
+                progress_callback=self._report,
             )
         except TypeError:
-            success = autobot.process_video_pipeline(self.channel_id, video)
+            success = autobot.process_video_pipeline(self._state.channel_id, video)
 
-        if not success and not self._stop_requested.is_set():
-            self.progress.emit(self.channel_id, tr("⚠ Pipeline finished with errors"))
+        if not success and not self._state.stop_requested.is_set():
+            self._report(tr("⚠ Pipeline finished with errors"))
 
         return bool(success)
 
-    def _create_video_from_url(self, url: str, channel_config: Dict[str, Any]) -> Optional[autobot.Video]:
+    @classmethod
+    def _extract_info(cls, url: str) -> Dict[str, Any]:
+        # YoutubeDL is not thread-safe, so the lock also serializes extraction
+        with cls._ydl_lock:
+            if cls._ydl_instance is None:
+                import yt_dlp
+
+                ydl_opts = {
+                    "quiet": True,
+                    "skip_download": True,
+                    "noplaylist": True,
+                    "cachedir": str(default_runtime_root() / "cache" / "yt-dlp"),
+                }
+                cls._ydl_instance = yt_dlp.YoutubeDL(ydl_opts)
+            return cls._ydl_instance.extract_info(url, download=False)
+
+    @classmethod
+    def close_shared_ydl(cls) -> None:
+        """Close the shared YoutubeDL and its connection pool, if idle."""
+        # Never block shutdown behind an extraction that is still in flight
+        if not cls._ydl_lock.acquire(blocking=False):
+            return
         try:
-            import yt_dlp
+            ydl, cls._ydl_instance = cls._ydl_instance, None
+        finally:
+            cls._ydl_lock.release()
+        if ydl is not None:
+            try:
+                ydl.close()
+            except Exception:
+                pass
 
-            ydl_opts = {"quiet": True, "skip_download": True, "noplaylist": True}
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+    @classmethod
+    def _fetch_video_info(cls, url: str) -> Dict[str, Any]:
+        now = time.monotonic()
+        with cls._video_info_lock:
+            hit = cls._video_info_cache.get(url)
+            if hit is not None and now - hit[0] < cls._VIDEO_INFO_TTL:
+                cls._video_info_cache.move_to_end(url)
+                return hit[1]
+
+        info = cls._extract_info(url)
+        meta = {
+            "id": info.get("id"),
+            "title": info.get("title"),
+            "upload_date": info.get("upload_date"),
+        }
+        if meta["id"]:
+            with cls._video_info_lock:
+                cls._video_info_cache[url] = (now, meta)
+                cls._video_info_cache.move_to_end(url)
+                while len(cls._video_info_cache) > cls._VIDEO_INFO_MAX:
+                    cls._video_info_cache.popitem(last=False)
+        return meta
+
+    @classmethod
+    def invalidate_video_info(cls, url: Optional[str] = None) -> None:
+        """Drop the cached metadata for ``url``, or everything when no URL is given."""
+        with cls._video_info_lock:
+            if url is None:
+                cls._video_info_cache.clear()
+            else:
+                cls._video_info_cache.pop(url.strip(), None)
+
+    def _create_video_from_url(self, url: str, channel_config: Dict[str, Any]) -> Optional[autobot.Video]:
+        try:
+            info = self._fetch_video_info(url)
 
             video_id = info.get("id")
-            title = info.get("title", video_id or "Unknown Title")
+            title = info.get("title") or video_id or "Unknown Title"
             upload_date = info.get("upload_date")
+            published = None
             if upload_date:
-                published = datetime.strptime(upload_date, "%Y%m%d").replace(tzinfo=timezone.utc).isoformat()
-            else:
+                # yt-dlp reports YYYYMMDD; slicing avoids strptime re-parsing its format each call
+                try:
+                    y, m, d = int(upload_date[0:4]), int(upload_date[4:6]), int(upload_date[6:8])
+                    published = datetime(y, m, d, tzinfo=timezone.utc).isoformat()
+                except ValueError:
+                    published = None
+            if published is None:
                 published = datetime.now(timezone.utc).isoformat()
 
             if not video_id:
@@ -222,8 +610,19 @@ class ChannelPipelineWorker(QThread):
             return None
 
 
+ChannelPipelineWorker._build_templates()
+translator.register_callback(ChannelPipelineWorker._build_templates)
+
+
 class ChannelDialog(QDialog):
     """Dialog for creating/editing channels"""
+
+    # Pipeline steps as bits of a single mask, in pipeline order
+    _STEP_SCAN = 1
+    _STEP_DOWNLOAD = 2
+    _STEP_RENDER = 4
+    _STEP_UPLOAD = 8
+    _STEP_BITS = {"scan": _STEP_SCAN, "download": _STEP_DOWNLOAD, "render": _STEP_RENDER, "upload": _STEP_UPLOAD}
     
     def __init__(self, config_manager, channel_id: str = None, parent=None):
         super().__init__(parent)
@@ -231,14 +630,22 @@ class ChannelDialog(QDialog):
         self.channel_id = channel_id
         self.is_editing = channel_id is not None
         self._updating_steps = False
-        self._syncing_proxy_text = False
         self.pipeline_checks = {}  # type: Dict[str, QCheckBox]
+        self._steps_mask = sum(self._STEP_BITS.values())
+        self._channel_data = None  # type: Optional[Tuple[Dict[str, Any], Any]]
+        # (requires_scan, scan checked) as last applied by _sync_scan_checkbox
+        self._last_sync_state = None  # type: Optional[Tuple[bool, bool]]
+        # (stripped cookies text, parsed value) of the last successful parse
+        self._parsed_cookies_cache = None  # type: Optional[Tuple[str, Any]]
+        # Parse the cookies JSON once typing pauses rather than on every keystroke
+        self._cookies_parse_timer = QTimer(self)
+        self._cookies_parse_timer.setSingleShot(True)
+        self._cookies_parse_timer.setInterval(250)
+        self._cookies_parse_timer.timeout.connect(self._on_cookies_text_changed)
         self.setup_ui()
         
         if self.is_editing:
             self.load_channel_data()
-        else:
-            self.set_pipeline_steps(self.config_manager._default_pipeline_steps())
     
     def setup_ui(self):
         self.setWindowTitle("Edit Channel" if self.is_editing else "New Channel")
@@ -247,34 +654,30 @@ class ChannelDialog(QDialog):
         
         layout = QVBoxLayout()
         
-        # Create tab widget for channel settings
-        tab_widget = QTabWidget()
-        
-        # Basic Settings Tab
-        basic_tab = self.create_basic_settings_tab()
-        tab_widget.addTab(basic_tab, tr("Basic Settings"))
-        
-        # YouTube Settings Tab
-        youtube_tab = self.create_youtube_settings_tab()
-        tab_widget.addTab(youtube_tab, tr("YouTube API"))
-        
-        # TikTok Settings Tab
-        tiktok_tab = self.create_tiktok_settings_tab()
-        tab_widget.addTab(tiktok_tab, tr("TikTok Settings"))
-        
-        # Pipeline Settings Tab
-        pipeline_tab = self.create_pipeline_settings_tab()
-        tab_widget.addTab(pipeline_tab, tr("Pipeline"))
-
-        # Advanced Settings Tab
-        advanced_tab = self.create_advanced_settings_tab()
-        tab_widget.addTab(advanced_tab, tr("Advanced"))
-        
-        # Cookies Tab
-        cookies_tab = self.create_cookies_tab()
-        tab_widget.addTab(cookies_tab, tr("Cookies"))
+        # Create tab widget for channel settings. Only the first tab is built
+        # up front; the others are built the first time they are needed.
+        self.tab_widget = QTabWidget()
+        self._tab_builders = {
+            "basic": (tr("Basic Settings"), self.create_basic_settings_tab, self._load_basic_settings),
+            "youtube": (tr("YouTube API"), self.create_youtube_settings_tab, self._load_youtube_settings),
+            "tiktok": (tr("TikTok Settings"), self.create_tiktok_settings_tab, self._load_tiktok_settings),
+            "pipeline": (tr("Pipeline"), self.create_pipeline_settings_tab, self._load_pipeline_settings),
+            "advanced": (tr("Advanced"), self.create_advanced_settings_tab, self._load_advanced_settings),
+            "cookies": (tr("Cookies"), self.create_cookies_tab, self._load_cookies_settings),
+        }
+        self._tab_pages: Dict[str, QWidget] = {}
+        self._built_tabs: set[str] = set()
+        for key, (label, _, _) in self._tab_builders.items():
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self._tab_pages[key] = page
+            self.tab_widget.addTab(page, label)
+        self._tab_keys = list(self._tab_builders)
+        self._ensure_tab(self._tab_keys[0])
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
-        layout.addWidget(tab_widget)
+        layout.addWidget(self.tab_widget)
         
         # Dialog buttons
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -285,6 +688,30 @@ class ChannelDialog(QDialog):
         self.setLayout(layout)
 
         translator.bind_widget_tree(self)
+
+    def _on_tab_changed(self, index: int):
+        if 0 <= index < len(self._tab_keys):
+            self._ensure_tab(self._tab_keys[index])
+
+    def _ensure_tab(self, key: str):
+        """Build the tab ``key`` on first use and fill it from the loaded channel."""
+        if key in self._built_tabs:
+            return
+        self._built_tabs.add(key)
+        _, factory, loader = self._tab_builders[key]
+        content = factory()
+        self._tab_pages[key].layout().addWidget(content)
+        if self._channel_data is not None:
+            loader(*self._channel_data)
+        elif key == "pipeline":
+            self.set_pipeline_steps(self.config_manager._default_pipeline_steps())
+        if key != self._tab_keys[0]:
+            # The first tab is bound together with the rest of the dialog in setup_ui
+            translator.bind_widget_tree(content)
+
+    def _ensure_all_tabs(self):
+        for key in self._tab_keys:
+            self._ensure_tab(key)
     
     def create_basic_settings_tab(self):
         widget = QWidget()
@@ -444,7 +871,7 @@ class ChannelDialog(QDialog):
         self.cookies_edit = QTextEdit()
         self.cookies_edit.setPlaceholderText('{"url": "https://www.tiktok.com", "cookies": [...]}')
         self._prepare_text_edit(self.cookies_edit)
-        self.cookies_edit.textChanged.connect(self._on_cookies_text_changed)
+        self.cookies_edit.textChanged.connect(self._cookies_parse_timer.start)
         layout.addWidget(self.cookies_edit)
 
         # Buttons for cookie management
@@ -489,12 +916,16 @@ class ChannelDialog(QDialog):
             "upload": tr("Upload rendered videos to TikTok"),
         }
 
+        # One non-exclusive group routes every toggle to a single slot, keyed by step bit
+        self._pipeline_group = QButtonGroup(self)
+        self._pipeline_group.setExclusive(False)
         for step, label in step_labels.items():
             checkbox = QCheckBox(label)
             checkbox.setChecked(True)
-            checkbox.stateChanged.connect(lambda _, s=step: self.on_pipeline_step_changed(s))
+            self._pipeline_group.addButton(checkbox, self._STEP_BITS[step])
             self.pipeline_checks[step] = checkbox
             steps_layout.addWidget(checkbox)
+        self._pipeline_group.idToggled.connect(self._on_pipeline_step_toggled)
 
         steps_group.setLayout(steps_layout)
         layout.addWidget(steps_group)
@@ -509,56 +940,68 @@ class ChannelDialog(QDialog):
         if self.channel_id in channels:
             config = channels[self.channel_id]['config']
             cookies = channels[self.channel_id]['cookies']
-            
-            # Basic settings
-            self.channel_id_edit.setText(config.get('youtube_channel_id', ''))
-            self.channel_name_edit.setText(config.get('channel_name', ''))
-            self.username_edit.setText(config.get('username', ''))
-            
-            # Parse telegram setting (chat_id|bot_token)
-            telegram = config.get('telegram', '')
-            if telegram and '|' in telegram:
-                chat_id, bot_token = telegram.split('|', 1)
-                self.telegram_chat_id_edit.setText(chat_id.strip())
-                self.telegram_bot_token_edit.setText(bot_token.strip())
-            else:
-                self.telegram_chat_id_edit.setText('')
-                self.telegram_bot_token_edit.setText('')
-            
-            # YouTube settings
-            self.api_key_edit.setPlainText(config.get('youtube_api_key', ''))
-            self.api_type_combo.setCurrentText(config.get('youtube_api_type', 'activities'))
-            self.scan_method_combo.setCurrentText(config.get('api_scan_method', 'sequence'))
-            self.detect_video_combo.setCurrentText(config.get('detect_video', 'websub'))
-            self.scan_interval_spin.setValue(config.get('scan_interval', 5))
-            self.is_new_second_spin.setValue(config.get('is_new_second', 36000000))
-            
-            # TikTok settings
-            self.upload_method_combo.setCurrentText(config.get('upload_method', 'api'))
-            self.region_combo.setCurrentText(config.get('region', 'ap-northeast-3'))
-            self.video_format_edit.setText(config.get('video_format', '18'))
-            self.render_method_combo.setCurrentText(config.get('render_video_method', 'repeat'))
-            self.is_human_check.setChecked(bool(config.get('is_human', 1)))
-            
-            # Advanced settings
-            proxy_value = str(config.get('proxy', '') or '').strip()
-            self._set_proxy_text(proxy_value)
-            self.user_agent_edit.setText(config.get('user_agent', ''))
-            self.viewport_edit.setText(config.get('view_port', '1280x720'))
-            
-            # Cookies
-            if cookies:
-                self.cookies_edit.setPlainText(json.dumps(cookies, indent=2))
-                if isinstance(cookies, dict):
-                    cookies_proxy = str(cookies.get('proxy', '') or '').strip()
-                    if cookies_proxy:
-                        self._set_proxy_text(cookies_proxy)
-
-            # Pipeline steps
-            self.set_pipeline_steps(config.get('pipeline_steps', {}))
+            self._channel_data = (config, cookies)
+            # Tabs built later are filled in by _ensure_tab
+            for key in self._tab_keys:
+                if key in self._built_tabs:
+                    self._tab_builders[key][2](config, cookies)
+
+    def _load_basic_settings(self, config: Dict[str, Any], cookies: Any):
+        self.channel_id_edit.setText(config.get('youtube_channel_id', ''))
+        self.channel_name_edit.setText(config.get('channel_name', ''))
+        self.username_edit.setText(config.get('username', ''))
+        
+        # Parse telegram setting (chat_id|bot_token)
+        telegram = config.get('telegram', '')
+        if telegram and '|' in telegram:
+            chat_id, bot_token = telegram.split('|', 1)
+            self.telegram_chat_id_edit.setText(chat_id.strip())
+            self.telegram_bot_token_edit.setText(bot_token.strip())
+        else:
+            self.telegram_chat_id_edit.setText('')
+            self.telegram_bot_token_edit.setText('')
+
+    def _load_youtube_settings(self, config: Dict[str, Any], cookies: Any):
+        self.api_key_edit.setPlainText(config.get('youtube_api_key', ''))
+        self.api_type_combo.setCurrentText(config.get('youtube_api_type', 'activities'))
+        self.scan_method_combo.setCurrentText(config.get('api_scan_method', 'sequence'))
+        self.detect_video_combo.setCurrentText(config.get('detect_video', 'websub'))
+        self.scan_interval_spin.setValue(config.get('scan_interval', 5))
+        self.is_new_second_spin.setValue(config.get('is_new_second', 36000000))
+
+    def _load_tiktok_settings(self, config: Dict[str, Any], cookies: Any):
+        self.upload_method_combo.setCurrentText(config.get('upload_method', 'api'))
+        self.region_combo.setCurrentText(config.get('region', 'ap-northeast-3'))
+        self.video_format_edit.setText(config.get('video_format', '18'))
+        self.render_method_combo.setCurrentText(config.get('render_video_method', 'repeat'))
+        self.is_human_check.setChecked(bool(config.get('is_human', 1)))
+
+    def _load_pipeline_settings(self, config: Dict[str, Any], cookies: Any):
+        self.set_pipeline_steps(config.get('pipeline_steps', {}))
+
+    def _load_advanced_settings(self, config: Dict[str, Any], cookies: Any):
+        proxy_value = str(config.get('proxy', '') or '').strip()
+        self._set_proxy_text(proxy_value)
+        self.user_agent_edit.setText(config.get('user_agent', ''))
+        self.viewport_edit.setText(config.get('view_port', '1280x720'))
+        # A proxy stored alongside the cookies takes precedence
+        if isinstance(cookies, dict):
+            cookies_proxy = str(cookies.get('proxy', '') or '').strip()
+            if cookies_proxy:
+                self._set_proxy_text(cookies_proxy)
+
+    def _load_cookies_settings(self, config: Dict[str, Any], cookies: Any):
+        if cookies:
+            text = _json_dumps_indented(cookies)
+            self._parsed_cookies_cache = (text, cookies)
+            self.cookies_edit.setPlainText(text)
+            # The loaded proxy is applied by the Advanced tab; no re-parse needed
+            self._cookies_parse_timer.stop()
     
     def get_channel_data(self):
         """Get channel data from UI"""
+        self._ensure_all_tabs()
+        self._flush_cookies_parse()
         proxy_value = self.proxy_edit.text().strip()
         self._set_proxy_text(proxy_value)
 
@@ -594,8 +1037,10 @@ class ChannelDialog(QDialog):
         cookies_text = self.cookies_edit.toPlainText().strip()
         if cookies_text:
             try:
-                cookies = json.loads(cookies_text)
+                cookies = self._get_parsed_cookies(cookies_text)
                 if isinstance(cookies, dict):
+                    # The parsed value is shared with the cache; copy before editing
+                    cookies = dict(cookies)
                     if proxy_value:
                         cookies['proxy'] = proxy_value
                     elif 'proxy' in cookies:
@@ -607,54 +1052,66 @@ class ChannelDialog(QDialog):
 
     def set_pipeline_steps(self, steps: Dict[str, Any]):
         sanitized = self.config_manager._sanitize_pipeline_steps(steps)
-        previous_state = self._updating_steps
-        self._updating_steps = True
-        for step, checkbox in self.pipeline_checks.items():
-            checkbox.setChecked(bool(sanitized.get(step, True)))
-        self._updating_steps = previous_state
+        mask = 0
+        for step, bit in self._STEP_BITS.items():
+            if sanitized.get(step, True):
+                mask |= bit
+        self._apply_steps_mask(mask)
         self._sync_scan_checkbox()
 
     def get_pipeline_steps(self) -> Dict[str, bool]:
-        return {step: checkbox.isChecked() for step, checkbox in self.pipeline_checks.items()}
+        mask = self._steps_mask
+        return {step: bool(mask & bit) for step, bit in self._STEP_BITS.items()}
+
+    @classmethod
+    def _normalize_steps_mask(cls, mask: int) -> int:
+        # Same dependency rules as _sanitize_pipeline_steps, applied to bits
+        if mask & cls._STEP_UPLOAD:
+            mask |= cls._STEP_RENDER | cls._STEP_DOWNLOAD
+        if mask & cls._STEP_RENDER:
+            mask |= cls._STEP_DOWNLOAD
+        if not mask & cls._STEP_RENDER:
+            mask &= ~cls._STEP_UPLOAD
+        if not mask & cls._STEP_DOWNLOAD:
+            mask &= ~(cls._STEP_RENDER | cls._STEP_UPLOAD)
+        return mask
+
+    def _apply_steps_mask(self, mask: int):
+        """Store ``mask`` and update only the checkboxes whose state differs."""
+        self._steps_mask = mask
+        previous_state = self._updating_steps
+        self._updating_steps = True
+        try:
+            for step, checkbox in self.pipeline_checks.items():
+                checked = bool(mask & self._STEP_BITS[step])
+                if checkbox.isChecked() != checked:
+                    checkbox.setChecked(checked)
+        finally:
+            self._updating_steps = previous_state
 
-    def on_pipeline_step_changed(self, step: str):
+    def _on_pipeline_step_toggled(self, bit: int, checked: bool):
         if self._updating_steps:
             return
-        self._updating_steps = True
-
-        steps_state = {name: cb.isChecked() for name, cb in self.pipeline_checks.items()}
-
-        if steps_state["upload"]:
-            steps_state["render"] = True
-            steps_state["download"] = True
-
-        if steps_state["render"] and not steps_state["download"]:
-            steps_state["download"] = True
-
-        if not steps_state["render"]:
-            steps_state["upload"] = False
-
-        if not steps_state["download"]:
-            steps_state["render"] = False
-            steps_state["upload"] = False
-
-        for name, checked in steps_state.items():
-            checkbox = self.pipeline_checks[name]
-            if checkbox.isChecked() != checked:
-                checkbox.setChecked(checked)
-
-        self._updating_steps = False
+        mask = self._steps_mask | bit if checked else self._steps_mask & ~bit
+        self._apply_steps_mask(self._normalize_steps_mask(mask))
         self._sync_scan_checkbox()
 
     def on_detect_video_changed(self, value: str):
         self._sync_scan_checkbox()
 
     def _sync_scan_checkbox(self):
-        detect_mode = self.detect_video_combo.currentText() if hasattr(self, 'detect_video_combo') else "api"
+        if "youtube" in self._built_tabs:
+            detect_mode = self.detect_video_combo.currentText()
+        elif self._channel_data is not None:
+            detect_mode = self._channel_data[0].get('detect_video', 'websub')
+        else:
+            detect_mode = "websub"
         requires_scan = detect_mode in {"websub", "both"}
         scan_checkbox = self.pipeline_checks.get("scan")
         if not scan_checkbox:
             return
+        if (requires_scan, scan_checkbox.isChecked()) == self._last_sync_state:
+            return
 
         previous_state = self._updating_steps
         self._updating_steps = True
@@ -662,6 +1119,7 @@ class ChannelDialog(QDialog):
             if requires_scan:
                 if not scan_checkbox.isChecked():
                     scan_checkbox.setChecked(True)
+                self._steps_mask |= self._STEP_SCAN
                 scan_checkbox.setEnabled(False)
                 scan_checkbox.setToolTip(tr("Scan is required when using WebSub detection modes."))
             else:
@@ -669,6 +1127,7 @@ class ChannelDialog(QDialog):
                 scan_checkbox.setToolTip("")
         finally:
             self._updating_steps = previous_state
+        self._last_sync_state = (requires_scan, scan_checkbox.isChecked())
 
     def _prepare_line_edit(self, widget: QLineEdit):
         widget.setMinimumWidth(320)
@@ -679,50 +1138,65 @@ class ChannelDialog(QDialog):
         widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
     def _set_proxy_text(self, text: str):
-        if self._syncing_proxy_text or not hasattr(self, "proxy_edit"):
-            return
+        self._ensure_tab("advanced")
         sanitized = (text or "").strip()
-        self._syncing_proxy_text = True
+        if sanitized == self.proxy_edit.text():
+            return
+        # Blocked signals keep setText from re-entering _on_advanced_proxy_changed
+        blocker = QSignalBlocker(self.proxy_edit)
         try:
-            current_proxy = self.proxy_edit.text() if self.proxy_edit else ""
-            if sanitized != current_proxy:
-                self.proxy_edit.setText(sanitized)
+            self.proxy_edit.setText(sanitized)
         finally:
-            self._syncing_proxy_text = False
+            blocker.unblock()
 
     def _on_advanced_proxy_changed(self, text: str):
         self._set_proxy_text(text)
 
+    def _flush_cookies_parse(self) -> None:
+        """Apply a still-debounced cookies edit before its text is used."""
+        if self._cookies_parse_timer.isActive():
+            self._cookies_parse_timer.stop()
+            self._on_cookies_text_changed()
+
     def _on_cookies_text_changed(self):
         text = self.cookies_edit.toPlainText().strip()
         if not text:
             return
         try:
-            data = json.loads(text)
+            data = self._get_parsed_cookies(text)
         except Exception:
             return
-        if isinstance(data, dict):
+        # Parsed JSON objects are always plain dicts, so an exact class check suffices
+        if data.__class__ is dict:
             proxy_value = str(data.get("proxy", "") or "").strip()
             if proxy_value:
                 self._set_proxy_text(proxy_value)
 
+    def _get_parsed_cookies(self, text: str) -> Any:
+        """Parse the stripped cookies ``text``, reusing the last result while it is unchanged.
+
+        The returned value is shared; callers copy it before modifying it.
+        """
+        cached = self._parsed_cookies_cache
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        parsed = _json_loads(text)
+        self._parsed_cookies_cache = (text, parsed)
+        return parsed
+
     @staticmethod
+    @lru_cache(maxsize=128)
     def _is_valid_proxy_format(proxy: str) -> bool:
         if not proxy:
             return True
-        parts = [part.strip() for part in proxy.split(":")]
-        if len(parts) not in (2, 4):
+        match = _PROXY_RE.fullmatch(proxy)
+        if match is None:
             return False
-        host, port = parts[0], parts[1]
-        if not host or not port.isdigit():
+        host, port, username, password = match.groups()
+        if not host.strip() or not 0 < int(port) <= 65535:
             return False
-        port_value = int(port)
-        if port_value < 1 or port_value > 65535:
+        if username is not None and (not username.strip() or not password.strip()):
             return False
-        if len(parts) == 4:
-            username, password = parts[2], parts[3]
-            if not username or not password:
-                return False
         return True
     
     def _test_proxy(self):
@@ -747,40 +1221,10 @@ class ChannelDialog(QDialog):
         
         # Parse proxy
         parts = proxy_text.split(":")
-        host = parts[0]
-        port = int(parts[1])
-        
-        proxy_dict = {
-            "http": f"http://{proxy_text}",
-            "https": f"http://{proxy_text}",
-        }
-        
+        proxy = QNetworkProxy(QNetworkProxy.HttpProxy, parts[0], int(parts[1]))
         if len(parts) == 4:
-            username, password = parts[2], parts[3]
-            proxy_dict = {
-                "http": f"http://{username}:{password}@{host}:{port}",
-                "https": f"http://{username}:{password}@{host}:{port}",
-            }
-        
-        # Create worker thread for testing
-        class ProxyTestWorker(QThread):
-            finished = Signal(bool, str)
-            
-            def __init__(self, proxy_dict):
-                super().__init__()
-                self.proxy_dict = proxy_dict
-            
-            def run(self):
-                try:
-                    import requests
-                    response = requests.get(
-                        "https://www.google.com",
-                        proxies=self.proxy_dict,
-                        timeout=10
-                    )
-                    self.finished.emit(True, tr("Proxy is working! Status code: {code}").format(code=response.status_code))
-                except Exception as e:
-                    self.finished.emit(False, tr("Proxy connection failed:\n{error}").format(error=str(e)))
+            proxy.setUser(parts[2])
+            proxy.setPassword(parts[3])
         
         # Show testing dialog
         dialog = QDialog(self)
@@ -805,9 +1249,6 @@ class ChannelDialog(QDialog):
         
         dialog.setLayout(layout)
         
-        # Create and start worker
-        worker = ProxyTestWorker(proxy_dict)
-        
         def on_test_finished(success, message):
             status_label.setText(message)
             progress.setRange(0, 1)
@@ -819,11 +1260,29 @@ class ChannelDialog(QDialog):
             else:
                 status_label.setStyleSheet("color: red;")
         
-        worker.finished.connect(on_test_finished)
-        worker.finished.connect(worker.deleteLater)
-        worker.start()
+        # The request runs on the event loop; no thread is needed
+        manager = _proxy_test_manager()
+        manager.setProxy(proxy)
+        reply = manager.get(QNetworkRequest(QUrl(_PROXY_TEST_URL)))
+        QTimer.singleShot(_PROXY_TEST_TIMEOUT_MS, reply, reply.abort)
+        
+        def on_reply_finished():
+            if reply.error() == QNetworkReply.NoError:
+                code = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+                on_test_finished(True, tr("Proxy is working! Status code: {code}").format(code=code))
+            else:
+                on_test_finished(False, tr("Proxy connection failed:\n{error}").format(error=reply.errorString()))
+        
+        reply.finished.connect(on_reply_finished)
         
         dialog.exec()
+        
+        # Closing the dialog early cancels the request instead of letting it
+        # report into widgets that are already gone
+        if reply.isRunning():
+            reply.finished.disconnect(on_reply_finished)
+            reply.abort()
+        reply.deleteLater()
     
     def load_cookies_from_file(self):
         """Load cookies from JSON file"""
@@ -836,9 +1295,11 @@ class ChannelDialog(QDialog):
         if file_path:
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
-                    cookies = json.load(f)
-                self.cookies_edit.setPlainText(json.dumps(cookies, indent=2))
-                if isinstance(cookies, dict):
+                    cookies = _json_loads(f.read())
+                text = _json_dumps_indented(cookies)
+                self._parsed_cookies_cache = (text, cookies)
+                self.cookies_edit.setPlainText(text)
+                if cookies.__class__ is dict:
                     self._set_proxy_text(cookies.get("proxy", ""))
                 QMessageBox.information(
                     self,
@@ -854,6 +1315,7 @@ class ChannelDialog(QDialog):
     
     def save_cookies_to_file(self):
         """Save cookies to JSON file"""
+        self._flush_cookies_parse()
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             tr("Save Cookies"),
@@ -863,7 +1325,8 @@ class ChannelDialog(QDialog):
         if file_path:
             try:
                 cookies_text = self.cookies_edit.toPlainText().strip()
-                proxy_text = self.cookies_proxy_edit.text().strip() if self.cookies_proxy_edit else ""
+                self._ensure_tab("advanced")
+                proxy_text = self.proxy_edit.text().strip()
                 if proxy_text and not self._is_valid_proxy_format(proxy_text):
                     QMessageBox.warning(
                         self,
@@ -872,14 +1335,14 @@ class ChannelDialog(QDialog):
                     )
                     return
                 if cookies_text:
-                    cookies = json.loads(cookies_text)
+                    cookies = self._get_parsed_cookies(cookies_text)
                     if isinstance(cookies, dict):
+                        cookies = dict(cookies)
                         if proxy_text:
                             cookies["proxy"] = proxy_text
                         elif "proxy" in cookies:
                             del cookies["proxy"]
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump(cookies, f, indent=2)
+                    _json_write_indented(file_path, cookies)
                     QMessageBox.information(
                         self,
                         tr("Success"),
@@ -900,18 +1363,18 @@ class ChannelDialog(QDialog):
     
     def validate_cookies(self):
         """Validate cookies JSON format"""
+        self._flush_cookies_parse()
         cookies_text = self.cookies_edit.toPlainText().strip()
         if not cookies_text:
             QMessageBox.warning(self, tr("Warning"), tr("No cookies to validate!"))
             return
         
         try:
-            cookies = json.loads(cookies_text)
-            proxy_text = ""
-            if isinstance(cookies, dict):
-                proxy_text = str(cookies.get("proxy", "") or "").strip()
-                if proxy_text:
-                    self._set_proxy_text(proxy_text)
+            cookies = self._get_parsed_cookies(cookies_text)
+            is_object = cookies.__class__ is dict
+            proxy_text = str(cookies.get("proxy", "") or "").strip() if is_object else ""
+            if proxy_text:
+                self._set_proxy_text(proxy_text)
             if proxy_text and not self._is_valid_proxy_format(proxy_text):
                 QMessageBox.warning(
                     self,
@@ -920,7 +1383,7 @@ class ChannelDialog(QDialog):
                 )
                 return
             # Basic validation
-            if isinstance(cookies, dict) and 'cookies' in cookies:
+            if is_object and 'cookies' in cookies:
                 QMessageBox.information(self, tr("Success"), tr("Cookies format is valid!"))
             else:
                 QMessageBox.warning(
@@ -964,6 +1427,366 @@ class ChannelDialog(QDialog):
             QMessageBox.critical(self, tr("Error"), tr("Failed to save channel!"))
 
 
+def _format_bool(value: Any) -> str:
+    return tr("Yes") if bool(value) else tr("No")
+
+
+@lru_cache(maxsize=512)
+def _join_api_keys(value: str) -> str:
+    cleaned = value.replace("\r", "\n")
+    parts = [part.strip() for part in cleaned.split("\n") if part.strip()]
+    return "; ".join(parts) if parts else ""
+
+
+def _format_api_keys(value: Any) -> str:
+    if not value:
+        return ""
+    if isinstance(value, str):
+        return _join_api_keys(value)
+    return str(value)
+
+
+# (channel_id, config, pipeline_steps, has_cookies, status_text) -> raw cell value
+ColumnResolver = Callable[[str, Dict[str, Any], Dict[str, bool], bool, str], Any]
+
+
+def _make_column_resolver(column_id: str, source: str, key: str) -> ColumnResolver:
+    if source == "channel_id":
+        return lambda channel_id, config, steps, has_cookies, status: channel_id
+    if source == "config":
+        if column_id == "channel_name":
+            return lambda channel_id, config, steps, has_cookies, status: (
+                config.get(key, "") or config.get("youtube_channel_id", channel_id)
+            )
+        return lambda channel_id, config, steps, has_cookies, status: config.get(key, "")
+    if source == "pipeline":
+        return lambda channel_id, config, steps, has_cookies, status: steps.get(key, False)
+    if source == "cookies":
+        return lambda channel_id, config, steps, has_cookies, status: has_cookies
+    if source == "status":
+        return lambda channel_id, config, steps, has_cookies, status: status
+    return lambda channel_id, config, steps, has_cookies, status: ""
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnDef:
+    """A channels table column; ``resolver`` is derived from ``source`` and ``key``."""
+
+    id: str
+    label: str
+    source: str
+    key: str = ""
+    default_visible: bool = True
+    width: int = 120
+    formatter: Optional[Callable[[Any], str]] = None
+    alignment: Optional[Qt.AlignmentFlag] = None
+    categorical: bool = False
+    resolver: ColumnResolver = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "resolver", _make_column_resolver(self.id, self.source, self.key))
+
+
+_CHANNEL_COLUMNS: Tuple[ColumnDef, ...] = (
+    ColumnDef("channel_id", "Channel ID", "channel_id", width=200),
+    ColumnDef("channel_name", "Channel Name", "config", key="channel_name", width=180),
+    ColumnDef("username", "TikTok Username", "config", key="username", width=180),
+    ColumnDef("telegram", "Telegram Override", "config", key="telegram", default_visible=False, width=200),
+    ColumnDef("detect_video", "Video Detection", "config", key="detect_video", width=110, categorical=True),
+    ColumnDef("youtube_api_type", "YouTube API Type", "config", key="youtube_api_type", default_visible=False, width=120, categorical=True),
+    ColumnDef("youtube_api_key", "YouTube API Keys", "config", key="youtube_api_key", default_visible=False, width=220, formatter=_format_api_keys),
+    ColumnDef("api_scan_method", "API Scan Method", "config", key="api_scan_method", default_visible=False, width=120, categorical=True),
+    ColumnDef("scan_interval", "Scan Interval (s)", "config", key="scan_interval", default_visible=False, width=100, alignment=Qt.AlignCenter),
+    ColumnDef("is_new_second", "New Video Threshold (s)", "config", key="is_new_second", default_visible=False, width=120, alignment=Qt.AlignCenter),
+    ColumnDef("upload_method", "Upload Method", "config", key="upload_method", width=110, categorical=True),
+    ColumnDef("region", "Region", "config", key="region", width=110, categorical=True),
+    ColumnDef("video_format", "Video Format", "config", key="video_format", default_visible=False, width=160, alignment=Qt.AlignCenter, categorical=True),
+    ColumnDef("render_video_method", "Render Method", "config", key="render_video_method", default_visible=False, width=120, categorical=True),
+    ColumnDef("is_human", "Human-like Behavior", "config", key="is_human", default_visible=False, width=100, formatter=_format_bool, alignment=Qt.AlignCenter),
+    ColumnDef("proxy", "Proxy", "config", key="proxy", default_visible=False, width=180),
+    ColumnDef("user_agent", "User Agent", "config", key="user_agent", default_visible=False, width=240),
+    ColumnDef("view_port", "Viewport Size", "config", key="view_port", default_visible=False, width=100, alignment=Qt.AlignCenter),
+    ColumnDef("pipeline_scan", "Pipeline: Scan", "pipeline", key="scan", default_visible=False, width=90, formatter=_format_bool, alignment=Qt.AlignCenter),
+    ColumnDef("pipeline_download", "Pipeline: Download", "pipeline", key="download", default_visible=False, width=90, formatter=_format_bool, alignment=Qt.AlignCenter),
+    ColumnDef("pipeline_render", "Pipeline: Render", "pipeline", key="render", default_visible=False, width=90, formatter=_format_bool, alignment=Qt.AlignCenter),
+    ColumnDef("pipeline_upload", "Pipeline: Upload", "pipeline", key="upload", default_visible=False, width=90, formatter=_format_bool, alignment=Qt.AlignCenter),
+    ColumnDef("cookies", "Has Cookies", "cookies", default_visible=False, width=90, formatter=_format_bool, alignment=Qt.AlignCenter),
+    ColumnDef("status", "Status", "status", width=260),
+    ColumnDef("actions", "Actions", "actions", width=150),
+)
+_HEADER_STATE_KEY = "channels_tab/header_state"
+# Shorter cell text fits its column, so a tooltip would only repeat it
+_TOOLTIP_MIN_LENGTH = 30
+_HEADER_SAVE_DELAY_MS = 500
+
+# Bit i set <=> column i is shown by default
+_DEFAULT_VISIBLE_MASK = sum(
+    1 << index for index, column in enumerate(_CHANNEL_COLUMNS) if column.default_visible
+)
+
+
+class ChannelsModel(QAbstractTableModel):
+    """Read-only table model exposing the cached channel rows to the channels view."""
+
+    def __init__(
+        self,
+        columns: Tuple[ColumnDef, ...],
+        cell_text: Callable[[int, str, Dict[str, Any], Dict[str, bool], bool], str],
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._columns = columns
+        self._cell_text = cell_text
+        # Per-column lookups resolved once instead of on every data() call
+        self._alignments = [column.alignment for column in columns]
+        self._text_columns = [column.source != "actions" for column in columns]
+        # Status changes constantly; every other text column depends only on the row data
+        self._cached_columns = [column.source not in ("actions", "status") for column in columns]
+        # Per-row display strings, filled on first request and dropped when the row changes
+        self._display: List[List[Optional[str]]] = []
+        # Parallel per-field lists indexed by row
+        self._ids: List[str] = []
+        self._configs: List[Dict[str, Any]] = []
+        self._steps: List[Dict[str, bool]] = []
+        self._cookies: List[bool] = []
+        self._fields = (self._ids, self._configs, self._steps, self._cookies)
+        self._row_by_id: Dict[str, int] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == Qt.DisplayRole or role == Qt.ToolTipRole:
+            if not self._text_columns[column]:
+                return None
+            row = index.row()
+            if self._cached_columns[column]:
+                cached = self._display[row]
+                value = cached[column]
+                if value is None:
+                    value = cached[column] = self._cell_text(
+                        column, self._ids[row], self._configs[row], self._steps[row], self._cookies[row]
+                    )
+            else:
+                value = self._cell_text(
+                    column, self._ids[row], self._configs[row], self._steps[row], self._cookies[row]
+                )
+            if role == Qt.ToolTipRole and len(value) <= _TOOLTIP_MIN_LENGTH:
+                return None
+            return value
+        if role == Qt.TextAlignmentRole:
+            return self._alignments[column]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self._columns):
+            return tr(self._columns[section].label)
+        return super().headerData(section, orientation, role)
+
+    def set_rows(self, rows: List[Tuple[str, Dict[str, Any], Dict[str, bool], bool]]) -> List[str]:
+        """Apply ``rows`` as a diff against the current rows and return the inserted ids."""
+        incoming = {row[0]: row for row in rows}
+
+        # Remove vanished channels bottom-up so pending row numbers stay valid
+        for index in range(len(self._ids) - 1, -1, -1):
+            if self._ids[index] not in incoming:
+                self.beginRemoveRows(QModelIndex(), index, index)
+                for column_field in self._fields:
+                    del column_field[index]
+                del self._display[index]
+                self.endRemoveRows()
+
+        last_column = len(self._columns) - 1
+        for index, channel_id in enumerate(self._ids):
+            _, config, steps, has_cookies = incoming[channel_id]
+            # get_channels hands back the same objects for unchanged channels
+            if (
+                config is self._configs[index]
+                and steps is self._steps[index]
+                and has_cookies == self._cookies[index]
+            ):
+                continue
+            changed = (
+                config != self._configs[index]
+                or steps != self._steps[index]
+                or has_cookies != self._cookies[index]
+            )
+            # Keep the new objects even when equal so the identity check hits next time
+            self._configs[index] = config
+            self._steps[index] = steps
+            self._cookies[index] = has_cookies
+            if changed:
+                self._display[index] = [None] * len(self._columns)
+                self.dataChanged.emit(self.index(index, 0), self.index(index, last_column))
+
+        known = set(self._ids)
+        added = [row for row in rows if row[0] not in known]
+        if added:
+            first = len(self._ids)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            for column_field, values in zip(self._fields, zip(*added)):
+                column_field.extend(values)
+            self._display.extend([None] * len(self._columns) for _ in added)
+            self.endInsertRows()
+
+        self._row_by_id = {channel_id: index for index, channel_id in enumerate(self._ids)}
+        return [row[0] for row in added]
+
+    def channel_id_at(self, row: int) -> Optional[str]:
+        if 0 <= row < len(self._ids):
+            return self._ids[row]
+        return None
+
+    def row_of(self, channel_id: str) -> int:
+        return self._row_by_id.get(channel_id, -1)
+
+    def refresh_cell(self, channel_id: str, column: int) -> None:
+        row = self._row_by_id.get(channel_id)
+        if row is None:
+            return
+        index = self.index(row, column)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.ToolTipRole])
+
+    def clear_display_cache(self) -> None:
+        """Drop every cached display string, e.g. after the language changed."""
+        self._display = [[None] * len(self._columns) for _ in self._ids]
+        if self._ids:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self._ids) - 1, len(self._columns) - 1)
+            )
+
+    def refresh_headers(self) -> None:
+        if self._columns:
+            self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._columns) - 1)
+
+
+class ChannelActionDelegate(QStyledItemDelegate):
+    """Paints the Start/Stop buttons of the Actions column and routes their clicks."""
+
+    _SPACING = 6
+    _PADDING = 12
+
+    def __init__(self, tab: "ChannelsTab"):
+        super().__init__(tab)
+        self._tab = tab
+        self._pressed: Optional[Tuple[str, int]] = None  # (channel id, button index)
+
+    def _button_rects(self, option) -> List[QRect]:
+        metrics = option.fontMetrics
+        rect = option.rect
+        height = max(0, rect.height() - 4)
+        top = rect.top() + (rect.height() - height) // 2
+        left = rect.left() + 2
+        rects = []
+        for text in (tr("Start"), tr("Stop")):
+            width = metrics.horizontalAdvance(text) + 2 * self._PADDING
+            rects.append(QRect(left, top, width, height))
+            left += width + self._SPACING
+        return rects
+
+    def _button_states(self, row: int) -> Tuple[bool, bool]:
+        channel_id = self._tab.channels_model.channel_id_at(row)
+        worker = self._tab.pipeline_workers.get(channel_id)
+        if worker is None:
+            return True, False
+        return False, not worker.is_stopping()
+
+    def _clear_pressed(self) -> None:
+        """Forget the pressed button and repaint its cell un-sunken."""
+        pressed, self._pressed = self._pressed, None
+        if pressed is not None:
+            self._tab.channels_model.refresh_cell(pressed[0], self._tab._actions_column)
+
+    def _button_at(self, option, position) -> Optional[int]:
+        for button, rect in enumerate(self._button_rects(option)):
+            if rect.contains(position):
+                return button
+        return None
+
+    def eventFilter(self, watched, event) -> bool:  # type: ignore[override]
+        table = self._tab.channels_table
+        event_type = event.type()
+        if watched is not table.viewport() or event_type not in (
+            QEvent.MouseButtonRelease, QEvent.MouseButtonDblClick
+        ):
+            return super().eventFilter(watched, event)
+
+        position = event.position().toPoint()
+        index = table.indexAt(position)
+        if index.column() != self._tab._actions_column:
+            # A release outside the Actions column never reaches editorEvent
+            if event_type == QEvent.MouseButtonRelease:
+                self._clear_pressed()
+            return False
+        if event_type == QEvent.MouseButtonDblClick:
+            # The view emits doubleClicked (which opens the edit dialog) before
+            # the delegate sees the event, so a double-click on a button, even a
+            # disabled one, is handled as a plain press here
+            option = QStyleOptionViewItem()
+            option.rect = table.visualRect(index)
+            option.fontMetrics = table.fontMetrics()
+            if self._button_at(option, position) is not None:
+                self.editorEvent(event, index.model(), option, index)
+                return True
+        return False
+
+    def paint(self, painter, option, index: QModelIndex) -> None:
+        super().paint(painter, option, index)
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        channel_id = self._tab.channels_model.channel_id_at(index.row())
+        enabled_states = self._button_states(index.row())
+        for button, (text, rect, enabled) in enumerate(
+            zip((tr("Start"), tr("Stop")), self._button_rects(option), enabled_states)
+        ):
+            button_option = QStyleOptionButton()
+            button_option.rect = rect
+            button_option.text = text
+            button_option.state = QStyle.State_Enabled if enabled else QStyle.State_None
+            if self._pressed == (channel_id, button) and enabled:
+                button_option.state |= QStyle.State_Sunken
+            else:
+                button_option.state |= QStyle.State_Raised
+            style.drawControl(QStyle.CE_PushButton, button_option, painter, widget)
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        rects = self._button_rects(option)
+        return QSize(rects[-1].right() - option.rect.left() + 4, option.fontMetrics.height() + 12)
+
+    def editorEvent(self, event, model, option, index: QModelIndex) -> bool:
+        event_type = event.type()
+        if event_type not in (QEvent.MouseButtonPress, QEvent.MouseButtonDblClick, QEvent.MouseButtonRelease):
+            return False
+
+        hit = self._button_at(option, event.position().toPoint())
+        channel_id = model.channel_id_at(index.row())
+        pressed = self._pressed
+        self._clear_pressed()
+        if hit is None:
+            return False
+        # Clicks on a button are consumed even when it is disabled, so the view
+        # never turns them into doubleClicked (which opens the edit dialog)
+        enabled = self._button_states(index.row())[hit]
+        if event_type == QEvent.MouseButtonRelease:
+            if enabled and pressed == (channel_id, hit):
+                if hit == 0:
+                    self._tab.start_channel_pipeline(channel_id)
+                else:
+                    self._tab.stop_channel_pipeline(channel_id)
+            return True
+
+        if enabled:
+            self._pressed = (channel_id, hit)
+            model.refresh_cell(channel_id, index.column())
+        return True
+
+
 class ChannelsTab(QWidget):
     """Tab for channel management"""
     
@@ -971,11 +1794,31 @@ class ChannelsTab(QWidget):
         super().__init__()
         self.config_manager = config_manager
         self.pipeline_workers: Dict[str, ChannelPipelineWorker] = {}
-        self.start_buttons: Dict[str, QPushButton] = {}
-        self.stop_buttons: Dict[str, QPushButton] = {}
-        self.status_items: Dict[str, QTableWidgetItem] = {}
         self.last_status_message: Dict[str, str] = {}
         self._channel_cache: Dict[str, Any] = {}
+        self._refresh_pending = False
+        self._status_pending: set[str] = set()
+        self._steps_cache: Dict[str, Tuple[Any, Dict[str, bool]]] = {}
+        self._scannable_ids: set[str] = set()
+
+        # Coalesces status repaints to at most one batch per frame
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(16)
+        self._status_timer.timeout.connect(self._flush_pending_status)
+
+        # Collapses refresh requests made in one event-loop turn into one rebuild
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh_channels)
+        # Resizing a section fires per pixel; write the header state once it settles
+        self._header_save_timer = QTimer(self)
+        self._header_save_timer.setSingleShot(True)
+        self._header_save_timer.setInterval(_HEADER_SAVE_DELAY_MS)
+        self._header_save_timer.timeout.connect(self._save_header_state)
+
+        self._retranslate_strings()
         self.setup_ui()
         self.refresh_channels()
         translator.register_callback(self._on_language_changed)
@@ -1021,33 +1864,48 @@ class ChannelsTab(QWidget):
         toolbar_layout.addStretch()
         
         # Channels table
-        self.channels_table = QTableWidget()
-        self.column_definitions = self._build_column_definitions()
-        self.channels_table.setColumnCount(len(self.column_definitions))
-        self.channels_table.setHorizontalHeaderLabels([
-            tr(column["label"]) for column in self.column_definitions
-        ])
+        self.channels_table = QTableView()
+        self.column_definitions = _CHANNEL_COLUMNS
+        self._status_column = self._column_index("status")
+        self._actions_column = self._column_index("actions")
+        self.channels_model = ChannelsModel(self.column_definitions, self._cell_text, self)
+        self.channels_table.setModel(self.channels_model)
+        self.actions_delegate = ChannelActionDelegate(self)
+        self.channels_table.setItemDelegateForColumn(self._actions_column, self.actions_delegate)
+        self.channels_table.viewport().installEventFilter(self.actions_delegate)
         for index, column in enumerate(self.column_definitions):
-            if not column.get("default_visible", True):
+            if not column.default_visible:
                 self.channels_table.setColumnHidden(index, True)
+        # Bit i mirrors "column i is shown"; kept in step with setColumnHidden
+        self._visible_mask = _DEFAULT_VISIBLE_MASK
         
         # Configure table
         header = self.channels_table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        # Interactive sections keep their width; ResizeToContents would measure
+        # every row of every visible column whenever the rows change
+        header.setSectionResizeMode(QHeaderView.Interactive)
         header.setStretchLastSection(False)
+        if not self._restore_header_state(header):
+            for index, column in enumerate(self.column_definitions):
+                self.channels_table.setColumnWidth(index, column.width)
+        header.sectionResized.connect(self._schedule_header_save)
         
-        self.channels_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.channels_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.channels_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.channels_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.channels_table.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.channels_table.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.channels_table.setWordWrap(False)
+        # Every row has the same height, tall enough for the Start/Stop buttons
+        vertical_header = self.channels_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(self.fontMetrics().height() + 12)
 
         self.column_actions: List[QAction] = []
         self._create_column_menu()
 
-        self.channels_table.itemSelectionChanged.connect(self.on_selection_changed)
-        self.channels_table.itemDoubleClicked.connect(self.edit_channel)
+        self.channels_table.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        self.channels_table.doubleClicked.connect(self.edit_channel)
         
         layout.addLayout(toolbar_layout)
         layout.addWidget(self.channels_table)
@@ -1069,22 +1927,21 @@ class ChannelsTab(QWidget):
         self.show_columns_menu.addSeparator()
         self.column_actions.clear()
         for index, column in enumerate(self.column_definitions):
-            action = QAction(column["label"], self)
+            action = QAction(column.label, self)
             action.setCheckable(True)
             action.setChecked(not self.channels_table.isColumnHidden(index))
-            action.toggled.connect(lambda checked, col=index: self.set_column_visible(col, checked))
+            action.setData(index)
+            action.toggled.connect(self._on_column_action_toggled)
             self.show_columns_menu.addAction(action)
             self.column_actions.append(action)
         self.show_columns_btn.setMenu(self.show_columns_menu)
 
     def _apply_localized_column_labels(self) -> None:
+        self.channels_model.refresh_headers()
         for index, column in enumerate(self.column_definitions):
-            header_item = self.channels_table.horizontalHeaderItem(index)
-            if header_item is not None:
-                header_item.setText(tr(column["label"]))
             if index < len(self.column_actions):
                 try:
-                    self.column_actions[index].setText(tr(column["label"]))
+                    self.column_actions[index].setText(tr(column.label))
                 except RuntimeError:
                     continue
 
@@ -1093,256 +1950,287 @@ class ChannelsTab(QWidget):
         if hasattr(self, "restore_columns_action"):
             self.restore_columns_action.setText(tr("Restore Default Columns"))
 
+    def _retranslate_strings(self) -> None:
+        """Translate the message templates used by the action handlers."""
+        self._delete_title_text = tr("Delete Channel")
+        self._delete_confirm_template = tr(
+            "Are you sure you want to delete channel '{channel_id}'?\nThis action cannot be undone."
+        )
+        self._delete_done_text = tr("Channel deleted successfully!")
+        self._delete_failed_text = tr("Failed to delete channel!")
+        self._success_title_text = tr("Success")
+        self._error_title_text = tr("Error")
+
     def _on_language_changed(self, _language: str) -> None:
+        self._retranslate_strings()
+        # Yes/No cells are translated when formatted, so cached text is stale now
+        self.channels_model.clear_display_cache()
         self._apply_localized_column_labels()
-        self.scan_interval_spin.setSuffix(f" {tr('seconds')}")
-        self.is_new_second_spin.setSuffix(f" {tr('seconds')}")
         self.last_status_message.clear()
         self.refresh_channels()
 
+    def _restore_header_state(self, header: QHeaderView) -> bool:
+        """Apply the header layout saved by a previous session, if any."""
+        state = QSettings("AutoBot", "GUI").value(_HEADER_STATE_KEY)
+        if not state or not header.restoreState(state):
+            return False
+        mask = 0
+        for index in range(len(self.column_definitions)):
+            if not header.isSectionHidden(index):
+                mask |= 1 << index
+        if not mask:
+            # A layout with nothing visible is useless; fall back to the defaults
+            for index, column in enumerate(self.column_definitions):
+                header.setSectionHidden(index, not column.default_visible)
+                header.resizeSection(index, column.width)
+            return False
+        self._visible_mask = mask
+        return True
+
+    def _schedule_header_save(self, *_args) -> None:
+        self._header_save_timer.start()
+
+    def _save_header_state(self) -> None:
+        self._header_save_timer.stop()
+        header = self.channels_table.horizontalHeader()
+        QSettings("AutoBot", "GUI").setValue(_HEADER_STATE_KEY, header.saveState())
+
     def _show_all_columns(self) -> None:
         for index in range(len(self.column_definitions)):
             self.channels_table.setColumnHidden(index, False)
+        self._visible_mask = (1 << len(self.column_definitions)) - 1
         self._sync_column_actions()
+        self._schedule_header_save()
 
     def _restore_default_columns(self) -> None:
         for index, column in enumerate(self.column_definitions):
-            self.channels_table.setColumnHidden(index, not column.get("default_visible", True))
+            self.channels_table.setColumnHidden(index, not column.default_visible)
+        self._visible_mask = _DEFAULT_VISIBLE_MASK
         self._sync_column_actions()
+        self._schedule_header_save()
 
-    def _build_column_definitions(self) -> List[Dict[str, Any]]:
-        return [
-            {"id": "channel_id", "label": "Channel ID", "source": "channel_id", "default_visible": True},
-            {"id": "channel_name", "label": "Channel Name", "source": "config", "key": "channel_name", "default_visible": True},
-            {"id": "username", "label": "TikTok Username", "source": "config", "key": "username", "default_visible": True},
-            {"id": "telegram", "label": "Telegram Override", "source": "config", "key": "telegram", "default_visible": False},
-            {"id": "detect_video", "label": "Video Detection", "source": "config", "key": "detect_video", "default_visible": True},
-            {"id": "youtube_api_type", "label": "YouTube API Type", "source": "config", "key": "youtube_api_type", "default_visible": False},
-            {"id": "youtube_api_key", "label": "YouTube API Keys", "source": "config", "key": "youtube_api_key", "default_visible": False, "formatter": self._format_api_keys},
-            {"id": "api_scan_method", "label": "API Scan Method", "source": "config", "key": "api_scan_method", "default_visible": False},
-            {"id": "scan_interval", "label": "Scan Interval (s)", "source": "config", "key": "scan_interval", "default_visible": False, "alignment": Qt.AlignCenter},
-            {"id": "is_new_second", "label": "New Video Threshold (s)", "source": "config", "key": "is_new_second", "default_visible": False, "alignment": Qt.AlignCenter},
-            {"id": "upload_method", "label": "Upload Method", "source": "config", "key": "upload_method", "default_visible": True},
-            {"id": "region", "label": "Region", "source": "config", "key": "region", "default_visible": True},
-            {"id": "video_format", "label": "Video Format", "source": "config", "key": "video_format", "default_visible": False, "alignment": Qt.AlignCenter},
-            {"id": "render_video_method", "label": "Render Method", "source": "config", "key": "render_video_method", "default_visible": False},
-            {"id": "is_human", "label": "Human-like Behavior", "source": "config", "key": "is_human", "default_visible": False, "formatter": self._format_bool, "alignment": Qt.AlignCenter},
-            {"id": "proxy", "label": "Proxy", "source": "config", "key": "proxy", "default_visible": False},
-            {"id": "user_agent", "label": "User Agent", "source": "config", "key": "user_agent", "default_visible": False},
-            {"id": "view_port", "label": "Viewport Size", "source": "config", "key": "view_port", "default_visible": False, "alignment": Qt.AlignCenter},
-            {"id": "pipeline_scan", "label": "Pipeline: Scan", "source": "pipeline", "key": "scan", "default_visible": False, "formatter": self._format_bool, "alignment": Qt.AlignCenter},
-            {"id": "pipeline_download", "label": "Pipeline: Download", "source": "pipeline", "key": "download", "default_visible": False, "formatter": self._format_bool, "alignment": Qt.AlignCenter},
-            {"id": "pipeline_render", "label": "Pipeline: Render", "source": "pipeline", "key": "render", "default_visible": False, "formatter": self._format_bool, "alignment": Qt.AlignCenter},
-            {"id": "pipeline_upload", "label": "Pipeline: Upload", "source": "pipeline", "key": "upload", "default_visible": False, "formatter": self._format_bool, "alignment": Qt.AlignCenter},
-            {"id": "cookies", "label": "Has Cookies", "source": "cookies", "default_visible": False, "formatter": self._format_bool, "alignment": Qt.AlignCenter},
-            {"id": "status", "label": "Status", "source": "status", "default_visible": True},
-            {"id": "actions", "label": "Actions", "source": "actions", "default_visible": True},
-        ]
-
-    @staticmethod
-    def _format_bool(value: Any) -> str:
-        return tr("Yes") if bool(value) else tr("No")
-
-    @staticmethod
-    def _format_api_keys(value: Any) -> str:
-        if not value:
-            return ""
-        if isinstance(value, str):
-            cleaned = value.replace("\r", "\n")
-            parts = [part.strip() for part in cleaned.split("\n") if part.strip()]
-            return "; ".join(parts) if parts else ""
-        return str(value)
+    def _column_index(self, column_id: str) -> int:
+        for index, column in enumerate(self.column_definitions):
+            if column.id == column_id:
+                return index
+        return -1
 
     def _resolve_column_value(
         self,
-        column: Dict[str, Any],
+        column: int,
         channel_id: str,
         config: Dict[str, Any],
         pipeline_steps: Dict[str, bool],
         has_cookies: bool,
         status_text: str,
     ) -> str:
-        source = column.get("source")
-        if source == "channel_id":
-            value = channel_id
-        elif source == "config":
-            value = config.get(column.get("key", ""), "")
-            if column["id"] == "channel_name" and not value:
-                value = config.get("youtube_channel_id", channel_id)
-        elif source == "pipeline":
-            value = pipeline_steps.get(column.get("key"), False)
-        elif source == "cookies":
-            value = has_cookies
-        elif source == "status":
-            value = status_text
-        else:
-            value = ""
+        column_def = self.column_definitions[column]
+        value = column_def.resolver(channel_id, config, pipeline_steps, has_cookies, status_text)
 
-        formatter = column.get("formatter")
+        formatter = column_def.formatter
         if formatter:
             value = formatter(value)
 
         if value is None:
             return ""
         if isinstance(value, str):
-            return value.strip()
+            value = value.strip()
+            # Categorical columns repeat a handful of values across every row
+            return sys.intern(value) if column_def.categorical else value
         return str(value)
 
-    def _create_actions_widget(self, channel_id: str, is_running: bool) -> QWidget:
-        controls_widget = QWidget()
-        controls_layout = QHBoxLayout(controls_widget)
-        controls_layout.setContentsMargins(0, 0, 0, 0)
-        controls_layout.setSpacing(6)
-
-        start_btn = QPushButton(tr("Start"))
-        stop_btn = QPushButton(tr("Stop"))
-
-        start_btn.setEnabled(not is_running)
-        stop_btn.setEnabled(is_running)
-
-        start_btn.clicked.connect(lambda checked, cid=channel_id: self.start_channel_pipeline(cid))
-        stop_btn.clicked.connect(lambda checked, cid=channel_id: self.stop_channel_pipeline(cid))
-
-        controls_layout.addWidget(start_btn)
-        controls_layout.addWidget(stop_btn)
-        controls_layout.addStretch()
-
-        self.start_buttons[channel_id] = start_btn
-        self.stop_buttons[channel_id] = stop_btn
-        return controls_widget
+    def _get_steps(self, channel_id: str, config: Dict[str, Any]) -> Dict[str, bool]:
+        raw = config.get("pipeline_steps")
+        hit = self._steps_cache.get(channel_id)
+        # Holding ``raw`` in the cache keeps its identity from being recycled
+        if hit is not None and hit[0] is raw:
+            return hit[1]
+        steps = autobot._sanitize_pipeline_steps(raw)
+        self._steps_cache[channel_id] = (raw, steps)
+        return steps
+
+    def _cell_text(
+        self,
+        column: int,
+        channel_id: str,
+        config: Dict[str, Any],
+        pipeline_steps: Dict[str, bool],
+        has_cookies: bool,
+    ) -> str:
+        return self._resolve_column_value(
+            column,
+            channel_id,
+            config,
+            pipeline_steps,
+            has_cookies,
+            self.last_status_message.get(channel_id, ""),
+        )
 
     def set_column_visible(self, column: int, visible: bool) -> None:
         if column < 0 or column >= len(self.column_definitions):
             return
 
-        if not visible:
-            remaining_visible = sum(
-                1
-                for idx in range(len(self.column_definitions))
-                if idx != column and not self.channels_table.isColumnHidden(idx)
-            )
-            if remaining_visible == 0:
-                action = self.column_actions[column]
-                action.blockSignals(True)
-                action.setChecked(True)
-                action.blockSignals(False)
-                return
+        bit = 1 << column
+        if bool(self._visible_mask & bit) == visible:
+            # Already in the requested state
+            return
+        if not visible and not self._visible_mask & ~bit:
+            # Keep at least one column on screen
+            action = self.column_actions[column]
+            action.blockSignals(True)
+            action.setChecked(True)
+            action.blockSignals(False)
+            return
 
         self.channels_table.setColumnHidden(column, not visible)
+        self._visible_mask ^= bit
         self._sync_column_actions()
+        self._schedule_header_save()
+
+    def _on_column_action_toggled(self, checked: bool) -> None:
+        action = self.sender()
+        if isinstance(action, QAction):
+            self.set_column_visible(action.data(), checked)
 
     def _sync_column_actions(self) -> None:
+        mask = self._visible_mask
         for idx, action in enumerate(self.column_actions):
-            desired = not self.channels_table.isColumnHidden(idx)
+            desired = bool(mask >> idx & 1)
             if action.isChecked() != desired:
                 action.blockSignals(True)
                 action.setChecked(desired)
                 action.blockSignals(False)
 
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        if self._refresh_pending:
+            self._refresh_timer.stop()
+            self._do_refresh_channels()
+        self._flush_pending_status()
+
+    def _flush_pending_status(self) -> None:
+        pending, self._status_pending = self._status_pending, set()
+        for channel_id in pending:
+            self.channels_model.refresh_cell(channel_id, self._status_column)
+
     def refresh_channels(self):
-        """Refresh channels list"""
+        """Refresh channels list on the next event-loop turn"""
+        self._refresh_timer.start()
+
+    def _do_refresh_channels(self) -> None:
+        if not self.isVisible():
+            # Off-screen: defer the work until the tab is shown again
+            self._refresh_pending = True
+            return
+        self._refresh_pending = False
+
         channels = self.config_manager.get_channels()
         self._channel_cache = channels
-        current_ids = set(channels.keys())
+        current_ids = channels.keys()
 
         # Clean up references for removed channels
-        for mapping in (self.start_buttons, self.stop_buttons, self.status_items, self.last_status_message):
-            for cid in list(mapping.keys()):
-                if cid not in current_ids:
-                    mapping.pop(cid, None)
-        for cid in list(self.pipeline_workers.keys()):
-            if cid not in current_ids:
-                worker = self.pipeline_workers.pop(cid)
-                worker.request_stop()
-                worker.deleteLater()
-        
-        self.start_buttons.clear()
-        self.stop_buttons.clear()
-        self.status_items.clear()
+        for mapping in (self.last_status_message, self._steps_cache):
+            for cid in mapping.keys() - current_ids:
+                del mapping[cid]
+        for cid in self.pipeline_workers.keys() - current_ids:
+            worker = self.pipeline_workers.pop(cid)
+            worker.finished.connect(worker.deleteLater)
+            worker.request_stop()
         
-        self.channels_table.setRowCount(len(channels))
-        
-        for row, (channel_id, data) in enumerate(channels.items()):
+        rows = []
+        scannable_ids = set()
+        ready_text = tr("✓ Ready")
+        no_cookies_text = tr("⚠ No Cookies")
+        running_text = tr("⏱ Running...")
+        for channel_id, data in channels.items():
             config = data['config']
-            pipeline_steps = autobot._sanitize_pipeline_steps(config.get("pipeline_steps"))
+            pipeline_steps = self._get_steps(channel_id, config)
             has_cookies = bool(data.get('cookies'))
-            is_running = channel_id in self.pipeline_workers
-            base_status = tr("✓ Ready") if has_cookies else tr("⚠ No Cookies")
-            default_status = tr("⏱ Running...") if is_running else base_status
-            status_text = self.last_status_message.get(channel_id, default_status)
-            self.last_status_message.setdefault(channel_id, status_text)
-
-            for column_index, column in enumerate(self.column_definitions):
-                source = column.get("source")
-                if source == "actions":
-                    controls_widget = self._create_actions_widget(channel_id, is_running)
-                    self.channels_table.setCellWidget(row, column_index, controls_widget)
-                    continue
-
-                value = self._resolve_column_value(
-                    column,
-                    channel_id,
-                    config,
-                    pipeline_steps,
-                    has_cookies,
-                    status_text,
-                )
-
-                item = QTableWidgetItem(value)
-                if value:
-                    item.setToolTip(value)
-                alignment = column.get("alignment")
-                if alignment is not None:
-                    item.setTextAlignment(alignment)
-                self.channels_table.setItem(row, column_index, item)
-                if column["id"] == "status":
-                    self.status_items[channel_id] = item
+            if channel_id not in self.last_status_message:
+                if channel_id in self.pipeline_workers:
+                    self.last_status_message[channel_id] = running_text
+                else:
+                    self.last_status_message[channel_id] = ready_text if has_cookies else no_cookies_text
+            rows.append((channel_id, config, pipeline_steps, has_cookies))
+            if pipeline_steps.get("scan", True):
+                scannable_ids.add(channel_id)
+        self._scannable_ids = scannable_ids
+
+        # Batch the row changes into a single repaint
+        table = self.channels_table
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        was_sorted = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        try:
+            self.channels_model.set_rows(rows)
+        finally:
+            table.setSortingEnabled(was_sorted)
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
 
         self.update_bulk_controls()
         self._sync_column_actions()
     
     def on_selection_changed(self):
         """Handle selection change"""
-        has_selection = len(self.channels_table.selectedItems()) > 0
+        has_selection = self.channels_table.selectionModel().hasSelection()
         self.edit_btn.setEnabled(has_selection)
         self.delete_btn.setEnabled(has_selection)
 
     def update_bulk_controls(self):
-        channels = getattr(self, "_channel_cache", {})
+        # _scannable_ids is rebuilt by refresh_channels, so this stays O(1) per call
         any_running = bool(self.pipeline_workers)
-        any_startable = False
-
-        for channel_id, data in channels.items():
-            if channel_id in self.pipeline_workers:
-                continue
-            config = data.get('config', {})
-            steps = autobot._sanitize_pipeline_steps(config.get("pipeline_steps"))
-            if steps.get("scan", True):
-                any_startable = True
-                break
+        any_startable = bool(self._scannable_ids - self.pipeline_workers.keys())
 
         self.start_all_btn.setEnabled(any_startable)
         self.stop_all_btn.setEnabled(any_running)
 
+    def _ask_manual_video_url(self) -> Tuple[str, bool]:
+        dialog = QInputDialog(self)
+        dialog.setInputMode(QInputDialog.TextInput)
+        dialog.setWindowTitle(tr("Manual Video URL"))
+        dialog.setLabelText(tr("Scan step is disabled. Provide a YouTube video URL to process:"))
+        line_edit = dialog.findChild(QLineEdit)
+        if line_edit is not None:
+            # Right-click offers a refresh when the video was edited on YouTube
+            line_edit.setContextMenuPolicy(Qt.CustomContextMenu)
+            line_edit.customContextMenuRequested.connect(
+                lambda pos, edit=line_edit: self._show_video_url_menu(edit, pos)
+            )
+        ok = dialog.exec() == QDialog.Accepted
+        video_url = dialog.textValue()
+        dialog.deleteLater()
+        return video_url, ok
+
+    def _show_video_url_menu(self, line_edit: QLineEdit, pos) -> None:
+        menu = line_edit.createStandardContextMenu()
+        menu.addSeparator()
+        refresh_action = menu.addAction(tr("Refresh Video Info"))
+        refresh_action.setEnabled(bool(line_edit.text().strip()))
+        refresh_action.triggered.connect(
+            lambda: ChannelPipelineWorker.invalidate_video_info(line_edit.text())
+        )
+        menu.exec(line_edit.mapToGlobal(pos))
+        menu.deleteLater()
+
     def start_all_channels(self):
         channels = self._channel_cache or self.config_manager.get_channels()
         if not channels:
             return
 
         skipped_manual = []
-        for channel_id, data in channels.items():
-            if channel_id in self.pipeline_workers:
-                continue
-
-            config = data.get('config', {})
-            steps = autobot._sanitize_pipeline_steps(config.get("pipeline_steps"))
+        idle_ids = [cid for cid in channels if cid not in self.pipeline_workers]
+        for channel_id in idle_ids:
+            data = channels[channel_id]
+            steps = self._get_steps(channel_id, data.get('config', {}))
 
             if not steps.get("scan", True):
                 skipped_manual.append(channel_id)
                 self.update_channel_status(channel_id, tr("⚠ Requires manual video URL"))
                 continue
 
-            self.start_channel_pipeline(channel_id)
+            self.start_channel_pipeline(channel_id, channel_data=data)
 
         if skipped_manual:
             QMessageBox.information(
@@ -1359,11 +2247,17 @@ class ChannelsTab(QWidget):
         if not self.pipeline_workers:
             return
 
-        for channel_id in list(self.pipeline_workers.keys()):
-            self.stop_channel_pipeline(channel_id)
+        stopping = tr("Stopping pipeline...")
+        for channel_id, worker in self.pipeline_workers.items():
+            worker.request_stop()
+            self.last_status_message[channel_id] = stopping
+            self._status_pending.add(channel_id)
+        # A single viewport repaint covers every row's Start/Stop buttons
+        self.channels_table.viewport().update()
+        self._flush_pending_status()
         self.update_bulk_controls()
 
-    def start_channel_pipeline(self, channel_id: str):
+    def start_channel_pipeline(self, channel_id: str, channel_data: Optional[Dict[str, Any]] = None):
         if channel_id in self.pipeline_workers:
             QMessageBox.information(
                 self,
@@ -1372,8 +2266,10 @@ class ChannelsTab(QWidget):
             )
             return
 
-        channels = self.config_manager.get_channels()
-        channel_data = channels.get(channel_id)
+        if channel_data is None:
+            channel_data = self._channel_cache.get(channel_id)
+        if channel_data is None:
+            channel_data = self.config_manager.get_channels().get(channel_id)
         if not channel_data:
             QMessageBox.warning(
                 self,
@@ -1382,17 +2278,11 @@ class ChannelsTab(QWidget):
             )
             return
 
-        pipeline_steps = autobot._sanitize_pipeline_steps(
-            channel_data['config'].get("pipeline_steps")
-        )
+        pipeline_steps = self._get_steps(channel_id, channel_data['config'])
 
         manual_video_url = None
         if not pipeline_steps.get("scan", True):
-            video_url, ok = QInputDialog.getText(
-                self,
-                tr("Manual Video URL"),
-                tr("Scan step is disabled. Provide a YouTube video URL to process:"),
-            )
+            video_url, ok = self._ask_manual_video_url()
             if not ok or not video_url.strip():
                 return
             manual_video_url = video_url.strip()
@@ -1414,10 +2304,7 @@ class ChannelsTab(QWidget):
 
         self.pipeline_workers[channel_id] = worker
 
-        if channel_id in self.start_buttons:
-            self.start_buttons[channel_id].setEnabled(False)
-        if channel_id in self.stop_buttons:
-            self.stop_buttons[channel_id].setEnabled(True)
+        self.channels_model.refresh_cell(channel_id, self._actions_column)
 
         self.update_channel_status(channel_id, tr("Starting pipeline..."))
         worker.start()
@@ -1428,8 +2315,7 @@ class ChannelsTab(QWidget):
         if not worker:
             return
         worker.request_stop()
-        if channel_id in self.stop_buttons:
-            self.stop_buttons[channel_id].setEnabled(False)
+        self.channels_model.refresh_cell(channel_id, self._actions_column)
         self.update_channel_status(channel_id, tr("Stopping pipeline..."))
         self.update_bulk_controls()
 
@@ -1441,10 +2327,7 @@ class ChannelsTab(QWidget):
         if worker:
             worker.deleteLater()
 
-        if channel_id in self.start_buttons:
-            self.start_buttons[channel_id].setEnabled(True)
-        if channel_id in self.stop_buttons:
-            self.stop_buttons[channel_id].setEnabled(False)
+        self.channels_model.refresh_cell(channel_id, self._actions_column)
 
         status_prefix = "✅" if success else "⚠"
         final_message = (
@@ -1456,68 +2339,85 @@ class ChannelsTab(QWidget):
         self.update_bulk_controls()
 
     def update_channel_status(self, channel_id: str, message: str):
+        if self.last_status_message.get(channel_id) == message:
+            return
         self.last_status_message[channel_id] = message
-        status_item = self.status_items.get(channel_id)
-        if status_item:
-            status_item.setText(message)
+        self._status_pending.add(channel_id)
+        # Hidden tabs are flushed from showEvent instead
+        if self.isVisible() and not self._status_timer.isActive():
+            self._status_timer.start()
     
     def add_channel(self):
         """Add new channel"""
         dialog = ChannelDialog(self.config_manager, parent=self)
         if dialog.exec() == QDialog.Accepted:
+            self._steps_cache.pop(dialog.channel_id_edit.text().strip(), None)
+            self._channel_cache = {}
             self.refresh_channels()
     
     def edit_channel(self):
         """Edit selected channel"""
-        current_row = self.channels_table.currentRow()
-        if current_row >= 0:
-            channel_id = self.channels_table.item(current_row, 0).text()
+        channel_id = self.channels_model.channel_id_at(self.channels_table.selectionModel().currentIndex().row())
+        if channel_id:
             dialog = ChannelDialog(self.config_manager, channel_id, parent=self)
             if dialog.exec() == QDialog.Accepted:
+                self._steps_cache.pop(channel_id, None)
+                self._channel_cache = {}
                 self.refresh_channels()
     
     def delete_channel(self):
         """Delete selected channel"""
-        current_row = self.channels_table.currentRow()
-        if current_row >= 0:
-            channel_id = self.channels_table.item(current_row, 0).text()
-            
+        channel_id = self.channels_model.channel_id_at(self.channels_table.selectionModel().currentIndex().row())
+        if channel_id:
             reply = QMessageBox.question(
                 self,
-                tr("Delete Channel"),
-                tr("Are you sure you want to delete channel '{channel_id}'?\nThis action cannot be undone.").format(
-                    channel_id=channel_id
-                ),
+                self._delete_title_text,
+                self._delete_confirm_template.format(channel_id=channel_id),
                 QMessageBox.Yes | QMessageBox.No
             )
             
             if reply == QMessageBox.Yes:
                 if self.config_manager.delete_channel(channel_id):
+                    self._steps_cache.pop(channel_id, None)
+                    self._channel_cache = {}
                     self.refresh_channels()
                     QMessageBox.information(
                         self,
-                        tr("Success"),
-                        tr("Channel deleted successfully!"),
+                        self._success_title_text,
+                        self._delete_done_text,
                     )
                 else:
-                    QMessageBox.critical(self, tr("Error"), tr("Failed to delete channel!"))
+                    QMessageBox.critical(self, self._error_title_text, self._delete_failed_text)
 
-    def prepare_shutdown(self) -> None:
-        for worker in list(self.pipeline_workers.values()):
+    def prepare_shutdown(self, timeout: float = 5.0) -> bool:
+        """Stop every pipeline, waiting at most ``timeout`` seconds in total.
+
+        Returns True when all workers finished before the deadline.
+        """
+        if self._header_save_timer.isActive():
+            self._save_header_state()
+        workers = tuple(self.pipeline_workers.items())
+        for _, worker in workers:
             try:
                 worker.request_stop()
             except Exception:
                 pass
 
-        for channel_id, worker in list(self.pipeline_workers.items()):
+        # One deadline shared by all workers, since they were all signalled above
+        deadline = time.monotonic() + timeout
+        all_clean = True
+        for channel_id, worker in workers:
             try:
-                if not worker.wait(5000):
-                    worker.terminate()
-                    worker.wait(1000)
+                # Pool tasks cannot be killed; the stop event ends them at the next check
+                remaining = max(0, int((deadline - time.monotonic()) * 1000))
+                if not worker.wait(remaining):
+                    all_clean = False
             except Exception:
-                pass
+                all_clean = False
             finally:
                 self.pipeline_workers.pop(channel_id, None)
+        ChannelPipelineWorker.close_shared_ydl()
+        return all_clean
 
 
 # Export the additional classes for the main file
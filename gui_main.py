@@ -12,7 +12,9 @@ import threading
 import time
 from functools import lru_cache
 from copy import deepcopy
+from types import MappingProxyType
 
+import autobot
 from autobot import ALL_CONFIGS, channel_events, event_lock, is_rendered, upload_to_tiktok
 
 from localization import translator, tr
@@ -246,6 +248,35 @@ class ConfigManager:
         self.settings_file = Path(settings_file)
         self.config_dir.mkdir(exist_ok=True)
         Path("log").mkdir(exist_ok=True)
+        # ((st_mtime_ns, st_size), settings) of the last parse of settings_file
+        self._settings_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+        # channel_id -> ((config signature, cookies signature), channel entry)
+        self._channels_cache: Dict[str, Tuple[Tuple[Any, Any], Dict[str, Any]]] = {}
+        self._cache_lock = threading.Lock()
+
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def load_settings_cached(self) -> Dict[str, Any]:
+        """Return global settings, re-reading the file only when it changed on disk.
+
+        The returned dict is shared between callers and must not be mutated.
+        Each freshly parsed copy is published to ``autobot.APP_CONFIGS``.
+        """
+        signature = self._file_signature(self.settings_file)
+        with self._cache_lock:
+            cached = self._settings_cache
+            if signature is not None and cached is not None and cached[0] == signature:
+                return cached[1]
+            settings = self.load_settings()
+            self._settings_cache = (signature, settings) if signature is not None else None
+            autobot.APP_CONFIGS = settings
+            return settings
 
     def load_settings(self) -> Dict[str, Any]:
         """Load global settings"""
@@ -262,17 +293,29 @@ class ConfigManager:
         try:
             with open(self.settings_file, 'w', encoding='utf-8') as f:
                 json.dump(settings, f, indent=2, ensure_ascii=False)
+            self._settings_cache = None
             return True
         except Exception as e:
             print(f"Error saving settings: {e}")
             return False
 
     def get_channels(self) -> Dict[str, Dict[str, Any]]:
-        """Get all channels configuration"""
+        """Get all channels configuration
+
+        Channel entries whose config/cookies files are unchanged on disk are
+        returned from cache, so the same entry object comes back across calls.
+        Entries are shared and must not be mutated.
+        """
         channels: Dict[str, Dict[str, Any]] = {}
         if not self.config_dir.exists():
+            with self._cache_lock:
+                self._channels_cache.clear()
             return channels
 
+        with self._cache_lock:
+            previous = dict(self._channels_cache)
+        fresh: Dict[str, Tuple[Tuple[Any, Any], Dict[str, Any]]] = {}
+
         for channel_dir in self.config_dir.iterdir():
             if not channel_dir.is_dir():
                 continue
@@ -281,7 +324,15 @@ class ConfigManager:
             config_file = channel_dir / "config.json"
             cookies_file = channel_dir / "cookies.json"
 
-            if not config_file.exists():
+            config_signature = self._file_signature(config_file)
+            if config_signature is None:
+                continue
+            signature = (config_signature, self._file_signature(cookies_file))
+
+            cached = previous.get(channel_id)
+            if cached is not None and cached[0] == signature:
+                channels[channel_id] = cached[1]
+                fresh[channel_id] = cached
                 continue
 
             try:
@@ -289,7 +340,7 @@ class ConfigManager:
                     config = json.load(f)
 
                 cookies: Dict[str, Any] = {}
-                if cookies_file.exists():
+                if signature[1] is not None:
                     with open(cookies_file, 'r', encoding='utf-8') as f:
                         cookies = json.load(f)
 
@@ -299,11 +350,18 @@ class ConfigManager:
                     'config': config,
                     'cookies': cookies
                 }
+                fresh[channel_id] = (signature, channels[channel_id])
             except Exception as e:
                 print(f"Error loading channel {channel_id}: {e}")
 
+        with self._cache_lock:
+            self._channels_cache = fresh
         return channels
 
+    def _invalidate_channel(self, channel_id: str) -> None:
+        with self._cache_lock:
+            self._channels_cache.pop(channel_id, None)
+
     def save_channel(self, channel_id: str, config: Dict[str, Any], cookies: Dict[str, Any]) -> bool:
         """Save channel configuration and cookies"""
         try:
@@ -320,6 +378,7 @@ class ConfigManager:
             with open(cookies_file, 'w', encoding='utf-8') as f:
                 json.dump(cookies, f, indent=2, ensure_ascii=False)
 
+            self._invalidate_channel(channel_id)
             return True
         except Exception as e:
             print(f"Error saving channel {channel_id}: {e}")
@@ -332,6 +391,7 @@ class ConfigManager:
             if channel_dir.exists():
                 import shutil
                 shutil.rmtree(channel_dir)
+            self._invalidate_channel(channel_id)
             return True
         except Exception as e:
             print(f"Error deleting channel {channel_id}: {e}")
@@ -371,7 +431,7 @@ class ConfigManager:
             "is_human": 1,
             "upload_method": "api",
             "region": "ap-northeast-3",
-            "pipeline_steps": self._default_pipeline_steps()
+            "pipeline_steps": dict(self._default_pipeline_steps())
         }
 
     def validate_settings(self, settings: Dict[str, Any]) -> List[str]:
@@ -435,16 +495,19 @@ class ConfigManager:
 
         return errors
 
-    def _default_pipeline_steps(self) -> Dict[str, bool]:
-        return {
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _default_pipeline_steps() -> MappingProxyType:
+        # Read-only and shared; callers that need to mutate take a dict() copy
+        return MappingProxyType({
             "scan": True,
             "download": True,
             "render": True,
             "upload": True,
-        }
+        })
 
     def _sanitize_pipeline_steps(self, pipeline_steps: Optional[Dict[str, Any]]) -> Dict[str, bool]:
-        defaults = self._default_pipeline_steps()
+        defaults = dict(self._default_pipeline_steps())
         if isinstance(pipeline_steps, dict):
             for key in defaults:
                 if key in pipeline_steps:
@@ -1643,6 +1706,26 @@ class TikTokUploadWorker(QThread):
                 channel_events.pop(self.channel_id, None)
 
 
+class ProxyTestWorker(QThread):
+    finished = Signal(bool, str)
+
+    def __init__(self, proxy_dict: Dict[str, str]) -> None:
+        super().__init__()
+        self.proxy_dict = proxy_dict
+
+    def run(self) -> None:
+        try:
+            import requests
+            response = requests.get(
+                "https://www.google.com",
+                proxies=self.proxy_dict,
+                timeout=10
+            )
+            self.finished.emit(True, tr("Proxy is working! Status code: {code}").format(code=response.status_code))
+        except Exception as e:
+            self.finished.emit(False, tr("Proxy connection failed:\n{error}").format(error=str(e)))
+
+
 class VideoPlayerDialog(QDialog):
     def __init__(self, video_path: str, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
@@ -2535,26 +2618,6 @@ class UtilitiesTab(QWidget):
                 "https": f"http://{username}:{password}@{host}:{port}",
             }
         
-        # Create worker thread for testing
-        class ProxyTestWorker(QThread):
-            finished = Signal(bool, str)
-            
-            def __init__(self, proxy_dict):
-                super().__init__()
-                self.proxy_dict = proxy_dict
-            
-            def run(self):
-                try:
-                    import requests
-                    response = requests.get(
-                        "https://www.google.com",
-                        proxies=self.proxy_dict,
-                        timeout=10
-                    )
-                    self.finished.emit(True, tr("Proxy is working! Status code: {code}").format(code=response.status_code))
-                except Exception as e:
-                    self.finished.emit(False, tr("Proxy connection failed:\n{error}").format(error=str(e)))
-        
         # Show testing dialog
         dialog = QDialog(self)
         dialog.setWindowTitle(tr("Testing Proxy"))
@@ -4002,7 +4065,9 @@ class AutoBotGUI(QMainWindow):
             if hasattr(self, "utilities_tab") and self.utilities_tab:
                 self.utilities_tab.prepare_shutdown()
             if hasattr(self, "channels_tab") and self.channels_tab:
-                self.channels_tab.prepare_shutdown()
+                if not self.channels_tab.prepare_shutdown():
+                    # The stragglers run on daemon threads and end with the process
+                    print("Some channel pipelines did not stop in time; abandoning them on exit")
         except Exception:
             pass
         super().closeEvent(event)
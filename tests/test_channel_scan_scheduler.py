@@ -0,0 +1,42 @@
+import threading
+
+from gui_channels import ChannelScanScheduler
+
+
+def test_scan_fires_while_processing_pool_is_busy():
+    scheduler = ChannelScanScheduler(max_workers=2, scan_workers=1)
+    release = threading.Event()
+    renders_started = threading.Barrier(3)
+
+    def render():
+        renders_started.wait(timeout=5)
+        release.wait(timeout=10)
+
+    try:
+        for _ in range(2):
+            scheduler.submit_processing(render)
+        renders_started.wait(timeout=5)
+
+        scanned = threading.Event()
+        scheduler.schedule(lambda: scheduler.submit(scanned.set), 0.05)
+        assert scanned.wait(timeout=2)
+    finally:
+        release.set()
+
+
+def test_failing_callback_does_not_stop_the_scheduler():
+    scheduler = ChannelScanScheduler()
+    fired = threading.Event()
+
+    def boom():
+        raise RuntimeError("boom")
+
+    scheduler.schedule(boom, 0)
+    scheduler.schedule(fired.set, 0.05)
+    assert fired.wait(timeout=2)
+
+
+def test_submit_returns_a_future_with_the_result():
+    scheduler = ChannelScanScheduler(scan_workers=1)
+    assert scheduler.submit(lambda value: value * 2, 21).result(timeout=2) == 42
+    assert scheduler.submit_processing(lambda: "done").result(timeout=2) == "done"